@@ -33,6 +33,10 @@ class Config:
 
     # Language detection settings
     primary_language: str = "ru"  # Primary language to detect (Russian)
+    # Use langdetect for words not decided by rules (slowest layer). On by default because
+    # without it more Sakha words fall through to pymorphy2 and are deleted as Russian
+    # (e.g. сылгы); set False to trade that accuracy for speed
+    use_langdetect: bool = True
 
     # Russian word removal settings
     use_v_as_russian_marker: bool = True  # Include 'в' as Russian marker (can be disabled)
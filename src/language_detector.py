@@ -5,11 +5,12 @@ Handles detection of Russian vs Sakha words using multiple strategies.
 
 from __future__ import annotations
 
-from typing import Optional, Set
+from functools import lru_cache
+from typing import Iterable, Optional, Set
 from pathlib import Path
 import regex
 import logging
-from langdetect import detect
+from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
 import pymorphy2
 from natasha import Segmenter, MorphVocab, NamesExtractor
 
@@ -26,9 +27,128 @@ from .constants import (
 )
 
 _CYRILLIC_RE = regex.compile(r"\p{IsCyrillic}+")
+# Precomputed lookups for the character-level classification layers
+_SAKHA_ANCHORS = frozenset(SAKHA_ANCHOR_CHARS)
+_SAKHA_DIPHTHONGS_RE = regex.compile("|".join(map(regex.escape, SAKHA_DIPHTHONGS)))
+_RUSSIAN_MARKERS = frozenset(RUSSIAN_MARKER_CHARS)
+_RUSSIAN_MARKERS_WITHOUT_V = _RUSSIAN_MARKERS - {"в"}
+_RUSSIAN_SUFFIXES = tuple(RUSSIAN_VERB_PATTERNS + RUSSIAN_ADJ_PATTERNS + RUSSIAN_NOUN_PATTERNS)
+_SAKHA_SUFFIXES = tuple(SAKHA_PLURAL_PATTERNS + SAKHA_POSSESSIVE_PATTERNS)
+
+
+def _suffix_alternation(suffixes: tuple) -> str:
+    """Build a longest-first regex alternation from a tuple of suffixes."""
+    return "|".join(map(regex.escape, sorted(set(suffixes), key=len, reverse=True)))
+
+
+# One reverse-searched regex classifies a word's ending as Sakha or Russian in a single pass.
+# The sakha group comes first, so if the suffix sets ever overlapped a Sakha ending would
+# win, as when Sakha patterns were checked first; a test keeps the sets disjoint.
+_SUFFIX_CLASS_RE = regex.compile(
+    rf"(?r)(?:(?P<sakha>{_suffix_alternation(_SAKHA_SUFFIXES)})"
+    rf"|(?P<russian>{_suffix_alternation(_RUSSIAN_SUFFIXES)}))\Z"
+)
+
+# Character-level flags produced by _scan_word
+_FLAG_SAKHA_ANCHOR = 1
+_FLAG_SAKHA_DIPHTHONG = 2
+_FLAG_RUSSIAN_MARKER = 4
+_SCAN_GROUP_FLAGS = {
+    "anchor": _FLAG_SAKHA_ANCHOR,
+    "diphthong": _FLAG_SAKHA_DIPHTHONG,
+    "marker": _FLAG_RUSSIAN_MARKER,
+}
+
+
+def _russian_markers() -> frozenset:
+    """Return the Russian marker set, honouring config.use_v_as_russian_marker."""
+    return _RUSSIAN_MARKERS if config.use_v_as_russian_marker else _RUSSIAN_MARKERS_WITHOUT_V
+
+
+def _build_scan_pattern(markers: frozenset) -> regex.Pattern:
+    """Build one alternation matching anchors, diphthongs and the given markers."""
+    anchors = regex.escape("".join(sorted(_SAKHA_ANCHORS)))
+    marker_chars = regex.escape("".join(sorted(markers)))
+    return regex.compile(
+        f"(?P<anchor>[{anchors}])"
+        f"|(?P<diphthong>{_SAKHA_DIPHTHONGS_RE.pattern})"
+        f"|(?P<marker>[{marker_chars}])"
+    )
+
+
+# Single-pass scanners, one per setting of config.use_v_as_russian_marker
+_SCAN_PATTERNS = {
+    markers: _build_scan_pattern(markers)
+    for markers in (_RUSSIAN_MARKERS, _RUSSIAN_MARKERS_WITHOUT_V)
+}
+
+
+def _scan_word(word: str) -> int:
+    """
+    Compute all character-level classification flags in one pass over the word.
+
+    An anchor decides the word on its own, so scanning stops at the first one.
+
+    Args:
+        word: Word to scan
+
+    Returns:
+        Bitwise OR of the _FLAG_* constants that apply to the word
+    """
+    flags = 0
+    for match in _SCAN_PATTERNS[_russian_markers()].finditer(word):
+        flag = _SCAN_GROUP_FLAGS[match.lastgroup]
+        if flag == _FLAG_SAKHA_ANCHOR:
+            return _FLAG_SAKHA_ANCHOR
+        flags |= flag
+    return flags
+
+
 logger = logging.getLogger("SaqaParser.language_detector")
 
 
+# Module-owned langdetect factory (lazy-loaded), seeded so results are reproducible
+_detector_factory: DetectorFactory | None = None
+
+
+def _get_detector_factory() -> DetectorFactory:
+    """
+    Get the langdetect DetectorFactory, loading language profiles on first use.
+
+    Returns:
+        DetectorFactory with profiles loaded and seed fixed to 0
+    """
+    global _detector_factory
+    if _detector_factory is None:
+        factory = DetectorFactory()
+        factory.load_profile(PROFILES_DIRECTORY)
+        factory.set_seed(0)
+        _detector_factory = factory
+    return _detector_factory
+
+
+@lru_cache(maxsize=131072)
+def _detect_language(word: str) -> str | None:
+    """
+    Detect the language of a single word with langdetect (memoized).
+
+    Words repeat heavily in real corpora and langdetect is by far the slowest
+    classification layer, so results are cached per exact word.
+
+    Args:
+        word: Stripped word to detect
+
+    Returns:
+        Language code, or None if langdetect could not decide
+    """
+    try:
+        detector = _get_detector_factory().create()
+        detector.append(word)
+        return str(detector.detect())
+    except Exception:
+        return None
+
+
 class AdditionalRulesLoader:
     """
     Loads words and their stems from text files in the additional folder.
@@ -262,7 +382,10 @@ class WordClassifier:
         Returns:
             True if word contains Sakha anchor characters
         """
-        return any(char in word for char in SAKHA_ANCHOR_CHARS)
+        if not word:
+            return False
+
+        return not _SAKHA_ANCHORS.isdisjoint(word)
 
     @staticmethod
     def has_sakha_diphthongs(word: str) -> bool:
@@ -275,7 +398,10 @@ class WordClassifier:
         Returns:
             True if word contains Sakha diphthongs
         """
-        return any(diphthong in word for diphthong in SAKHA_DIPHTHONGS)
+        if not word:
+            return False
+
+        return _SAKHA_DIPHTHONGS_RE.search(word) is not None
 
     @staticmethod
     def has_russian_marker_chars(word: str) -> bool:
@@ -288,11 +414,11 @@ class WordClassifier:
         Returns:
             True if word contains Russian marker characters
         """
-        markers = RUSSIAN_MARKER_CHARS.copy()
-        # Remove 'в' if disabled in config
-        if not config.use_v_as_russian_marker:
-            markers.discard("в")
-        return any(char in word for char in markers)
+        if not word:
+            return False
+
+        # Excludes 'в' if disabled in config
+        return not _russian_markers().isdisjoint(word)
 
     @staticmethod
     def matches_russian_patterns(word: str) -> bool:
@@ -305,20 +431,11 @@ class WordClassifier:
         Returns:
             True if word matches Russian patterns
         """
-        word_lower = word.lower()
-
-        # Check verb patterns
-        for pattern in RUSSIAN_VERB_PATTERNS:
-            if word_lower.endswith(pattern):
-                return True
-
-        # Check adjective patterns
-        for pattern in RUSSIAN_ADJ_PATTERNS:
-            if word_lower.endswith(pattern):
-                return True
+        if not word:
+            return False
 
-        # Check noun patterns
-        return any(word_lower.endswith(pattern) for pattern in RUSSIAN_NOUN_PATTERNS)
+        # Verb, adjective and noun endings in one C-level endswith call
+        return word.lower().endswith(_RUSSIAN_SUFFIXES)
 
     @staticmethod
     def matches_sakha_patterns(word: str) -> bool:
@@ -331,15 +448,11 @@ class WordClassifier:
         Returns:
             True if word matches Sakha patterns
         """
-        word_lower = word.lower()
-
-        # Check plural patterns
-        for pattern in SAKHA_PLURAL_PATTERNS:
-            if word_lower.endswith(pattern):
-                return True
+        if not word:
+            return False
 
-        # Check possessive patterns
-        return any(word_lower.endswith(pattern) for pattern in SAKHA_POSSESSIVE_PATTERNS)
+        # Plural and possessive endings in one C-level endswith call
+        return word.lower().endswith(_SAKHA_SUFFIXES)
 
     def is_russian_word(self, word: str) -> bool:
         """
@@ -363,12 +476,12 @@ class WordClassifier:
         if not word:
             return False
 
+        # Anchor, diphthong and marker flags for layers 1 and 2 in a single scan
+        flags = _scan_word(word)
+
         # LAYER 1: Sakha Anchor Rules (HIGHEST PRIORITY - KEEP)
         # If word contains Sakha-specific characters or diphthongs, keep it
-        if self.has_sakha_anchor_chars(word):
-            return False  # Keep word (not Russian)
-
-        if self.has_sakha_diphthongs(word):
+        if flags & (_FLAG_SAKHA_ANCHOR | _FLAG_SAKHA_DIPHTHONG):
             return False  # Keep word (not Russian)
 
         # LAYER 1.5: Additional Rules (HIGH PRIORITY - DELETE)
@@ -378,31 +491,32 @@ class WordClassifier:
 
         # LAYER 2: Russian Marker Rules (HIGH PRIORITY - DELETE)
         # If word contains Russian-specific characters, delete it
-        if self.has_russian_marker_chars(word):
+        if flags & _FLAG_RUSSIAN_MARKER:
             return True  # Delete word (Russian)
 
         # LAYER 3: Morphological Pattern Rules
-        # Check Sakha patterns first (if matches, keep)
-        if self.matches_sakha_patterns(word):
-            return False  # Keep word (Sakha pattern)
-
-        # Check Russian patterns (if matches, delete)
-        if self.matches_russian_patterns(word):
-            return True  # Delete word (Russian pattern)
+        # Sakha pattern keeps the word, Russian pattern deletes it
+        suffix = _SUFFIX_CLASS_RE.search(word.lower())
+        if suffix is not None:
+            kind: str | None = suffix.lastgroup
+            return kind == "russian"
+
+        # Words without any Cyrillic letter cannot be Russian: keep them without running
+        # langdetect, the names extractor or pymorphy2. Latin-script names are therefore
+        # always kept; langdetect never reported Latin script as Russian, so it kept them too
+        if not _CYRILLIC_RE.search(word):
+            return False  # Keep word (not Cyrillic)
 
         # LAYER 4: Fallback to Existing Logic
         # Language detection - should distinguish Russian from Sakha
-        detected_lang = None
-        try:
-            detected_lang = detect(word)
-            if detected_lang == config.primary_language:
-                # Language detection says it's Russian - trust this
-                return True
-            elif detected_lang and detected_lang != config.primary_language:
-                # Language detection says it's NOT Russian (e.g., Sakha) - trust this
-                return False
-        except Exception:
-            pass
+        detected_lang = _detect_language(word) if config.use_langdetect else None
+        primary_language = config.primary_language
+        if detected_lang == primary_language:
+            # Language detection says it's Russian - trust this
+            return True
+        elif detected_lang and detected_lang != primary_language:
+            # Language detection says it's NOT Russian (e.g., Sakha) - trust this
+            return False
 
         # Russian names & surnames
         matches = self.names_extractor(word)
@@ -412,6 +526,7 @@ class WordClassifier:
         # Morphological analysis - only trust if language detection was inconclusive
         # pymorphy2 is specifically for Russian morphology, but it might parse Sakha words too
         # So we need to be more strict
+        word_lower = word.lower()
         try:
             parses = self.morph.parse(word)
             if parses:
@@ -423,7 +538,7 @@ class WordClassifier:
                         p.tag is not None
                         and str(p.tag) != "UNKN"
                         and p.normal_form
-                        and p.normal_form != word.lower()
+                        and p.normal_form != word_lower
                         and detected_lang is None
                     ):
                         # This suggests it's a real Russian word with morphology
@@ -432,20 +547,33 @@ class WordClassifier:
         except Exception:
             pass
 
-        # Cyrillic check - only as absolute last resort
+        # Cyrillic check - only as absolute last resort (the word is known to be Cyrillic here)
         # Only use if language detection failed AND morphological analysis suggests Russian
-        if _CYRILLIC_RE.search(word) and detected_lang is None:
+        if detected_lang is None:
             try:
                 parses = self.morph.parse(word)
                 if parses and any(p.tag is not None and str(p.tag) != "UNKN" for p in parses):
                     # Only if we have a normalized form (suggests real Russian word)
-                    if any(p.normal_form and p.normal_form != word.lower() for p in parses):
+                    if any(p.normal_form and p.normal_form != word_lower for p in parses):
                         return True
             except Exception:
                 pass
 
         return False
 
+    def classify_many(self, words: Iterable[str]) -> dict[str, bool]:
+        """
+        Classify a batch of words, running the rules once per distinct word.
+
+        Args:
+            words: Words to classify (duplicates are allowed)
+
+        Returns:
+            Mapping of each distinct word to True if Russian (delete), False otherwise (keep)
+        """
+        is_russian_word = self.is_russian_word
+        return {word: is_russian_word(word) for word in dict.fromkeys(words)}
+
 
 # Global instance for convenience (lazy-loaded)
 _classifier_instance: Optional[WordClassifier] = None
@@ -4,6 +4,7 @@ Parquet processing module for extracting text from Parquet files.
 
 from __future__ import annotations
 
+import os
 import pandas as pd
 import shutil
 from pathlib import Path
@@ -371,7 +372,14 @@ class ParquetProcessor(BaseProcessor):
         Returns:
             Number of files processed successfully
         """
-        parquet_files = list(self.input_folder.glob("*.parquet"))
+        # Direct suffix check on scandir entries avoids glob's per-entry pattern matching;
+        # the suffix is compared case-insensitively, as glob("*.parquet") does on Windows
+        with os.scandir(self.input_folder) as entries:
+            parquet_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.lower().endswith(".parquet") and entry.is_file()
+            ]
 
         if not parquet_files:
             logger.warning(f"No Parquet files found in input folder: {self.input_folder}")
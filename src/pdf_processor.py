@@ -8,7 +8,7 @@ import pdfplumber
 import shutil
 import regex
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Tuple, Optional
 import logging
 
 from .config import config
@@ -78,7 +78,7 @@ class PDFProcessor(BaseProcessor):
         if not pdf_path.suffix.lower() == ".pdf":
             raise ValidationError(f"File is not a PDF: {pdf_path}")
 
-        extracted_text = ""
+        page_texts: list[str] = []  # Joined once after the loop (no quadratic concatenation)
         page_count = 0
         warning_counts: Dict[str, int] = {}  # Dictionary to count repeating warnings
 
@@ -92,7 +92,7 @@ class PDFProcessor(BaseProcessor):
                         page, page_num, warning_counts
                     )
                     if page_text:
-                        extracted_text += page_text
+                        page_texts.append(page_text)
 
                     # Show progress
                     if page_num % config.progress_interval_pages == 0 or page_num == page_count:
@@ -106,6 +106,7 @@ class PDFProcessor(BaseProcessor):
                         logger.warning(f"{count} {page_word}: {warning_msg}")
 
                 # Merge hyphenated line breaks in the complete extracted text
+                extracted_text = "".join(page_texts)
                 extracted_text, merge_count = self._merge_hyphenated_line_breaks(extracted_text)
                 if merge_count > 0:
                     logger.info(f"Merged {merge_count} hyphenated line break(s) in extracted text")
@@ -58,6 +58,11 @@ class ProgressBar:
         if not self.is_tty or self.disable:
             self.disable = True
 
+        # Swap in state-only methods so the disabled hot path skips all rendering checks
+        if self.disable:
+            self.update = self._update_disabled  # type: ignore[method-assign]
+            self.finish = self._finish_disabled  # type: ignore[method-assign]
+
     def update(self, current: int, suffix: str = "") -> None:
         """
         Update progress bar to current position.
@@ -138,6 +143,26 @@ class ProgressBar:
         sys.stderr.write("\n")
         sys.stderr.flush()
 
+    def _update_disabled(self, current: int, suffix: str = "") -> None:
+        """
+        Track progress state without producing output (used when disabled).
+
+        Args:
+            current: Current progress value (0 to total)
+            suffix: Ignored, accepted for signature compatibility with update()
+        """
+        self.current = min(current, self.total)
+
+    def _finish_disabled(self, suffix: str = "") -> None:
+        """
+        Mark progress as finished without producing output (used when disabled).
+
+        Args:
+            suffix: Ignored, accepted for signature compatibility with finish()
+        """
+        self.finished = True
+        self.current = self.total
+
     def _format_time(self, seconds: float) -> str:
         """
         Format time duration in human-readable format.
@@ -5,6 +5,7 @@ Text cleaning module for removing Russian words and special characters.
 from __future__ import annotations
 
 import regex
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional
 import logging
@@ -12,15 +13,21 @@ import logging
 from .config import config
 from .utils import format_file_size, get_timestamp
 from .exceptions import TextCleaningError, MissingFileError
-from .language_detector import get_classifier
+from .language_detector import WordClassifier, get_classifier
 from .base_processor import BaseProcessor
+from .word_healer import WordHealer
 from .progress import ProgressBar
 
 logger = logging.getLogger("SaqaParser.text_cleaner")
 
 # Pre-compiled regex patterns for performance
 _WORD_PATTERN = regex.compile(r"[\p{L}]+(?:[-–_\n][\p{L}]+)*")
-_LETTER_SPACE_NEWLINE_HYPHEN_PATTERN = regex.compile(r"[\p{L} \n-]")
+# Everything except letters, spaces, newlines and hyphens (deleted by remove_special_characters)
+_SPECIAL_CHARACTERS_PATTERN = regex.compile(r"[^\p{L} \n-]")
+# ASCII-only equivalent as a str.translate deletion table (C-level per-character lookup)
+_ASCII_SPECIAL_CHARACTERS_TABLE = {
+    code: None for code in range(128) if not (chr(code).isalpha() or chr(code) in " \n-")
+}
 _SPACED_LETTERS_PATTERN = regex.compile(r"\b(?:\p{L}\s+)+\p{L}\b")
 # Pattern for words that may include hyphens (compound words) and optional dots
 # Matches: letters, optionally hyphenated parts, optionally a dot at the end
@@ -48,12 +55,21 @@ class TextCleaner(BaseProcessor):
         super().__init__(log_file=log_file or config.log_file)
         self.input_file = input_file or config.output_file
         self.output_file = output_file or config.cleaned_output_file
-        self.classifier = get_classifier()
 
         # Validate paths using base class methods
         self.validate_file(self.input_file, must_exist=True, must_be_file=True)
         self.ensure_output_directory(self.output_file)
 
+    @cached_property
+    def classifier(self) -> WordClassifier:
+        """Shared WordClassifier, looked up on first use (not needed for static cleaning)."""
+        return get_classifier()
+
+    @cached_property
+    def healer(self) -> WordHealer:
+        """WordHealer built on first use and reused for every clean() call (keeps its caches)."""
+        return WordHealer()
+
     def remove_russian_words(self, text: str) -> str:
         """
         Remove Russian words from text.
@@ -65,18 +81,33 @@ class TextCleaner(BaseProcessor):
             Text with Russian words removed
         """
         # Extract words that may contain separators (-, –, _, \n)
-        # Pattern matches sequences of letters with optional separators between them
+        # Pattern matches sequences of letters with optional separators between them.
+        # text.split() is not a substitute: it would split "оҕо\nлор" into two words and
+        # keep punctuation/digits attached, changing which tokens get classified.
         words = _WORD_PATTERN.findall(text)
 
         total_words = len(words)
         logger.info(f"Processing {total_words} words...")
 
+        # Classify each distinct word once (in batches, for progress reporting);
+        # natural text repeats words heavily
+        unique_words = list(dict.fromkeys(words))
+        total_unique = len(unique_words)
+        batch_size = config.progress_interval_words
+        verdicts: dict[str, bool] = {}
+        progress = ProgressBar(total=total_unique, desc="Filtering words")
+
+        for start in range(0, total_unique, batch_size):
+            batch = unique_words[start : start + batch_size]
+            verdicts.update(self.classifier.classify_many(batch))
+            progress.update(start + len(batch))
+
+        progress.finish()
+
         russian_words_found = []
         clean_words = []
-        progress = ProgressBar(total=total_words, desc="Filtering words")
-
-        for i, w in enumerate(words, 1):
-            if self.classifier.is_russian_word(w):
+        for w in words:
+            if verdicts[w]:
                 russian_words_found.append(w)
             else:
                 # For non-Russian words, replace separators (–, _, \n) with spaces
@@ -87,12 +118,6 @@ class TextCleaner(BaseProcessor):
                 if cleaned_word:  # Only add if word is not empty after cleaning
                     clean_words.append(cleaned_word)
 
-            # Update progress bar
-            if i % config.progress_interval_words == 0 or i == total_words:
-                progress.update(i)
-
-        progress.finish()
-
         # Debug: show sample of Russian words found
         if russian_words_found:
             sample = russian_words_found[: config.debug_sample_size]
@@ -120,15 +145,11 @@ class TextCleaner(BaseProcessor):
         Returns:
             Text with special characters removed
         """
-        # Pattern to match: Unicode letters, spaces, newlines, or hyphens
+        # Delete everything that is not a Unicode letter, space, newline, or hyphen
         # \p{L} matches any Unicode letter (includes Cyrillic and Latin)
-        # Space character, \n for line breaks, and - for compound words
-
-        # Find all matching characters (letters, spaces, newlines, hyphens)
-        matches = _LETTER_SPACE_NEWLINE_HYPHEN_PATTERN.findall(text)
-
-        # Join the matches back together
-        return "".join(matches)
+        if text.isascii():
+            return text.translate(_ASCII_SPECIAL_CHARACTERS_TABLE)
+        return str(_SPECIAL_CHARACTERS_PATTERN.sub("", text))
 
     def filter_invalid_words(self, text: str) -> str:
         """
@@ -297,10 +318,7 @@ class TextCleaner(BaseProcessor):
         step_num = 2
         if config.word_healer_enabled:
             logger.info(f"Step {step_num}: Applying word healing to repair OCR-broken words...")
-            from .word_healer import WordHealer
-
-            healer = WordHealer()
-            text_no_special = healer.heal_text(text_no_special)
+            text_no_special = self.healer.heal_text(text_no_special)
             logger.info("Word healing complete.")
             step_num += 1
 
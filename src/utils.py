@@ -4,9 +4,18 @@ Utility functions for SaqaParser project.
 
 from __future__ import annotations
 
+import os
+import stat
+import time
 from pathlib import Path
 from datetime import datetime
 
+# Last formatted timestamp, reused while the wall-clock second is unchanged
+_last_timestamp_second: int = -1
+_last_timestamp: str = ""
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 
 def validate_path(path: Path, must_exist: bool = True, must_be_file: bool = False) -> bool:
     """
@@ -20,16 +29,16 @@ def validate_path(path: Path, must_exist: bool = True, must_be_file: bool = Fals
     Returns:
         True if path is valid, False otherwise
     """
-    if must_exist and not path.exists():
-        return False
+    if not must_exist:
+        return True
 
-    if must_exist:
-        if must_be_file and not path.is_file():
-            return False
-        if not must_be_file and not path.is_dir():
-            return False
+    # One stat call answers existence and file/directory type together
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
 
-    return True
+    return stat.S_ISREG(mode) if must_be_file else stat.S_ISDIR(mode)
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -42,12 +51,11 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    size: float = float(size_bytes)
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{size:.1f} TB"
+    if size_bytes < 1024:
+        return f"{float(size_bytes):.1f} B"
+    # Each unit step is 2**10, so the bit length picks the unit directly (capped at TB)
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
 
 
 def get_timestamp() -> str:
@@ -57,7 +65,12 @@ def get_timestamp() -> str:
     Returns:
         Timestamp string in format "YYYY-MM-DD HH:MM:SS"
     """
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _last_timestamp_second, _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp_second:
+        _last_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _last_timestamp_second = now
+    return _last_timestamp
 
 
 def get_timestamp_folder_name() -> str:
@@ -11,10 +11,15 @@ This module handles:
 
 from __future__ import annotations
 
+import os
 import re
 import logging
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Set, Optional, Match
+from typing import Iterable, Iterator, Optional, Match, Pattern
 
 from .config import config
 from .constants import (
@@ -34,56 +39,307 @@ logger = logging.getLogger("SaqaParser.word_healer")
 # Special marker for word boundaries (must be unique and unlikely to appear in text)
 WORD_BOUNDARY_MARKER = "__WORD_BOUNDARY__"
 
+# Longest text heal_text memoizes; whole documents are healed uncached
+_HEAL_CACHE_MAX_TEXT_LENGTH = 4096
+# Texts memoized per healer (each entry keeps its input and output alive)
+_HEAL_CACHE_SIZE = 256
+
+# Private-use character that marks the joins in heal_text_batch; a batch containing
+# it is healed text by text
+_BATCH_MARK = "\ue000"
+# Joins texts in heal_text_batch. Each comma ends a normalization context scan, and the
+# comma plus the mark fill the nearby-digit window, so every scan stops at a join just
+# as it would at the end of the text; no merge pattern matches across it either
+_BATCH_SEPARATOR = f",{_BATCH_MARK},"
+
+# Immutable copy of the Sakha anchor letters for isdisjoint checks
+_SAKHA_ANCHORS = frozenset(SAKHA_ANCHOR_CHARS)
+# Separators that make a numeric match a protected sequence (dates, phone numbers)
+_NUMERIC_SEPARATORS = frozenset("-./")
+
 # Pre-compiled regex patterns for performance
 _MULTI_SPACE_PATTERN = re.compile(r"\s{2,}")
+# Substitution for _MULTI_SPACE_PATTERN (literal: the marker has no backslashes)
+_BLOCK_REPLACEMENT = f" {WORD_BLOCK_MARKER} "
 _WHITESPACE_PATTERN = re.compile(r"\s+")
 _NUMERIC_PATTERN = re.compile(r"\d+[\s\-\.]?\d*")
 
-# Build Cyrillic pattern once
+# Build Cyrillic pattern once. The letter set is expanded up front from the caseless
+# class (upper/lower Cyrillic and Sakha letters, plus the Cyrillic Extended-C forms
+# U+1C80-U+1C86 that case folding maps onto them), so matching needs no IGNORECASE
 _cyrillic_chars = "".join(SAKHA_ALL_CHARS)
-_CYRILLIC_PATTERN = re.compile(rf"[а-яё{re.escape(_cyrillic_chars)}]", re.IGNORECASE)
+_CASELESS_CYRILLIC_PATTERN = re.compile(rf"[а-яё{re.escape(_cyrillic_chars)}]", re.IGNORECASE)
+_CHAR_CLASS_SIZE = 0x1D00  # Past the last codepoint the caseless class matches
+_CYRILLIC_LETTERS = "".join(
+    chr(code) for code in range(_CHAR_CLASS_SIZE) if _CASELESS_CYRILLIC_PATTERN.match(chr(code))
+)
+_CYRILLIC_LETTER_SET = frozenset(_CYRILLIC_LETTERS)
+_CYRILLIC_CLASS = f"[{re.escape(_CYRILLIC_LETTERS)}]"
+_CYRILLIC_PATTERN = re.compile(_CYRILLIC_CLASS)
 # Pattern to match Cyrillic sequences separated by spaces
 # Matches: Cyrillic sequence + whitespace + Cyrillic sequence
 # The validation function ensures we're merging broken words (not separate words)
-_STRICT_MERGE_PATTERN = re.compile(
-    rf"([а-яё{re.escape(_cyrillic_chars)}]+)\s+([а-яё{re.escape(_cyrillic_chars)}]+)",
-    re.IGNORECASE,
-)
+_STRICT_MERGE_PATTERN = re.compile(rf"({_CYRILLIC_CLASS}+)\s+({_CYRILLIC_CLASS}+)")
+# Two multi-character sequences merge only if their combined length is at most this
+_MAX_MULTI_CHAR_MERGE_LENGTH = 7
 # Pattern for line-break hyphens: word-hyphen-newline(s)-word (OCR artifact)
 # Does NOT match word-word (legitimate hyphenated compound words)
-_FALSE_HYPHEN_PATTERN = re.compile(r"(\w+)-\n+(\w+)")
+# Anchored at a word start: a match can only begin there anyway, and the anchor stops
+# the engine from retrying every position inside long words with no hyphen
+_FALSE_HYPHEN_PATTERN = re.compile(r"\b(\w+)-\n+(\w+)")
+# One scan for smart_normalize: boundary markers, numeric sequences, and map characters
+# (markers never contain digits and candidates never start a numeric match, so each
+# alternative finds exactly what a separate scan would)
+_NORMALIZE_SCAN_PATTERN = re.compile(
+    f"(?P<marker>{re.escape(WORD_BLOCK_MARKER)}|{re.escape(WORD_BOUNDARY_MARKER)})"
+    f"|(?P<numeric>{_NUMERIC_PATTERN.pattern})"
+    f"|(?P<candidate>[{re.escape(''.join(SAKHA_NORMALIZATION_MAP))}])"
+)
+
+
+def _merge_candidate_alternatives() -> list[str]:
+    """Regex alternatives for Cyrillic sequence pairs the repair step could merge."""
+    letter = _CYRILLIC_CLASS
+    not_before = f"(?<!{letter})"
+    not_after = f"(?!{letter})"
+    gap = r"[^\S\n]+"  # Whitespace without a newline (superset of the gaps repair accepts)
+    alternatives = [
+        f"{not_before}{letter}{gap}{letter}",  # single character first
+        f"{letter}{gap}{letter}{not_after}",  # single character second
+    ]
+    # Two multi-character sequences that are short enough together
+    for first in range(2, _MAX_MULTI_CHAR_MERGE_LENGTH - 1):
+        alternatives.append(
+            f"{not_before}{letter}{{{first}}}{gap}"
+            f"{letter}{{2,{_MAX_MULTI_CHAR_MERGE_LENGTH - first}}}{not_after}"
+        )
+    return alternatives
+
+
+# Quick check for heal_text: text with none of these (a normalization candidate, a
+# line-break hyphen, or a mergeable sequence pair) only needs whitespace cleanup
+_HEALING_CANDIDATE_PATTERN = re.compile(
+    "|".join(
+        [
+            f"[{re.escape(''.join(SAKHA_NORMALIZATION_MAP))}]",
+            "-\n",
+            *_merge_candidate_alternatives(),
+        ]
+    )
+)
+
+# Per-codepoint character classes (bit flags), indexed by ord(char). The table spans
+# every codepoint in _CYRILLIC_LETTERS; anything beyond it is never Cyrillic.
+_CHAR_CYRILLIC = 1
+_CHAR_VOWEL = 2
+_CHAR_SPACE = 4
+_CHAR_CONTEXT_STOP = 8  # Punctuation that ends a normalization context scan
+_CHAR_CLASS = bytearray(_CHAR_CLASS_SIZE)
+for _code in range(_CHAR_CLASS_SIZE):
+    if chr(_code).isspace():
+        _CHAR_CLASS[_code] |= _CHAR_SPACE
+for _letter in _CYRILLIC_LETTERS:
+    _CHAR_CLASS[ord(_letter)] |= _CHAR_CYRILLIC
+for _vowel in SAKHA_VOWELS:
+    _CHAR_CLASS[ord(_vowel)] |= _CHAR_VOWEL
+# heal_text_batch relies on "," being a stop (see the batch separator checks below)
+for _stop in ".,;:!?":
+    _CHAR_CLASS[ord(_stop)] |= _CHAR_CONTEXT_STOP
+del _code, _letter, _vowel, _stop
+
+
+class _ConsonantMask(dict):
+    """str.translate table mapping consonants to "C" and every other character to "."."""
+
+    def __missing__(self, code: int) -> str:
+        # Only reached for codepoints beyond _CHAR_CLASS, which are never Cyrillic
+        return "."
+
+
+# Consonant = Cyrillic letter that is not a vowel; a word fails the phonetic check
+# when its mask contains _CONSONANT_RUN
+_CONSONANT_MASK = _ConsonantMask(
+    (code, "C" if flags & (_CHAR_CYRILLIC | _CHAR_VOWEL) == _CHAR_CYRILLIC else ".")
+    for code, flags in enumerate(_CHAR_CLASS)
+)
+_CONSONANT_RUN = "C" * MAX_CONSONANT_SEQUENCE
+
+# Normalization looks past at most this many non-space, non-Cyrillic characters
+_CONTEXT_WINDOW = 5
+# A lone 6 or 8 is part of a number if a digit is within this many non-space characters
+_NEARBY_DIGIT_DISTANCE = 2
+
+# heal_text_batch heals texts joined by _BATCH_SEPARATOR in one run, which matches
+# per-text healing only while no step can see across a join. Changing the context stops,
+# the digit window or the separator must keep these true:
+# - the normalization context scan stops at the separator's first and last characters
+assert all(
+    _CHAR_CLASS[ord(char)] & _CHAR_CONTEXT_STOP
+    for char in (_BATCH_SEPARATOR[0], _BATCH_SEPARATOR[-1])
+), "batch separator must end the normalization context scan"
+# - the nearby-digit scan gives up before it has stepped over the whole separator
+assert len(_BATCH_SEPARATOR) > _NEARBY_DIGIT_DISTANCE, "digit scan must not cross a batch join"
+# - merge, hyphen and numeric patterns need whitespace, word characters, "-" or "."
+assert not re.search(r"[\s\w.-]", _BATCH_SEPARATOR), "patterns must not match into a batch join"
+
+
+def _is_cyrillic_char(char: str) -> bool:
+    """
+    Check if a single character is Cyrillic (including Sakha letters).
+
+    A table lookup: the check runs for every context character inspected
+    during normalization and merging.
+
+    Args:
+        char: Single character to check
+
+    Returns:
+        True if the character is a Cyrillic letter
+    """
+    code = ord(char)
+    return code < _CHAR_CLASS_SIZE and bool(_CHAR_CLASS[code] & _CHAR_CYRILLIC)
+
+
+def _has_sakha(text: str) -> bool:
+    """Return True if text contains any Sakha-specific anchor letter."""
+    # isdisjoint stops at the first shared character without building a set from text
+    return not _SAKHA_ANCHORS.isdisjoint(text)
+
+
+@lru_cache(maxsize=65536)
+def _has_valid_consonant_runs(word: str) -> bool:
+    """
+    Check that word has no run of MAX_CONSONANT_SEQUENCE or more consonants.
+
+    Memoized per word: the same candidates recur across repair passes and
+    across the lines of a corpus.
+
+    Args:
+        word: Word to check
+
+    Returns:
+        True if no consonant run is too long
+    """
+    # Map each character to "C" (consonant) or "." and search for a long enough run;
+    # vowels and non-Cyrillic characters end a run
+    return _CONSONANT_RUN not in word.translate(_CONSONANT_MASK)
+
+
+def clear_caches() -> None:
+    """Clear the module-level per-word caches."""
+    _has_valid_consonant_runs.cache_clear()
+
+
+def _wide_char_flags(char: str) -> int:
+    """Class flags for a character beyond _CHAR_CLASS (never Cyrillic)."""
+    return _CHAR_SPACE if char.isspace() else 0
+
+
+def _has_cyrillic_context(chars: list[str], indices: range) -> bool:
+    """
+    Look for a Cyrillic letter along indices, skipping whitespace.
+
+    The scan gives up at punctuation (.,;:!?) and after _CONTEXT_WINDOW other
+    non-space characters.
+
+    Args:
+        chars: Characters of the text being normalized
+        indices: Positions to visit, nearest first
+
+    Returns:
+        True if a Cyrillic letter is reached
+    """
+    checked = 0
+    for j in indices:
+        code = ord(chars[j])
+        flags = _CHAR_CLASS[code] if code < _CHAR_CLASS_SIZE else _wide_char_flags(chars[j])
+        if flags & _CHAR_CONTEXT_STOP:
+            return False
+        if flags & _CHAR_SPACE:
+            continue
+        if flags & _CHAR_CYRILLIC:
+            return True
+        checked += 1
+        if checked >= _CONTEXT_WINDOW:
+            return False
+    return False
+
+
+def _merge_false_hyphen(match: Match[str]) -> str:
+    """Join a hyphen-newline split word if both parts contain Cyrillic, else keep it."""
+    part1, part2 = match.group(1, 2)
+    # isascii is a constant-time flag check: an ASCII part has no Cyrillic
+    if (
+        not part1.isascii()
+        and not part2.isascii()
+        and not _CYRILLIC_LETTER_SET.isdisjoint(part1)
+        and not _CYRILLIC_LETTER_SET.isdisjoint(part2)
+    ):
+        # Merge directly without hyphen or space (it's one word split across lines)
+        return part1 + part2
+    return match.group(0)  # Keep original
 
 
 class WordHealer:
     """Repairs OCR-broken Sakha words with smart normalization and merging."""
 
-    def __init__(self, exceptions_file: Optional[Path] = None):
+    def __init__(self, exceptions_file: Path | Iterable[str] | None = None):
         """
         Initialize Word Healer.
 
         Args:
-            exceptions_file: Optional path to exceptions file (one pattern per line)
+            exceptions_file: Optional path to exceptions file (one pattern per line),
+                or an already open file-like object / iterable of such lines
         """
         self.exceptions_file = exceptions_file or config.word_healer_exceptions_file
-        self._exception_patterns: Optional[List[str]] = None
+        self._exception_patterns: list[str] = []
+        self._exception_patterns_lower: tuple[str, ...] = ()
         self._load_exceptions()
+        # Per-instance memo of check_exceptions results (patterns are fixed after loading)
+        self._check_exceptions_cached = lru_cache(maxsize=4096)(self._match_exceptions)
+        self._heal_cached = lru_cache(maxsize=_HEAL_CACHE_SIZE)(self._heal)
 
     def _load_exceptions(self) -> None:
         """Load exception patterns from built-in list and optional file."""
         self._exception_patterns = list(WORD_HEALER_EXCEPTIONS)
 
+        source = self.exceptions_file
+        if source is not None and not isinstance(source, (str, Path)):
+            # File-like object or iterable of lines: read it directly
+            self._add_exception_lines(source)
         # Load from file if it exists
-        if self.exceptions_file and Path(self.exceptions_file).exists():
+        elif source and Path(source).exists():
             try:
-                with open(self.exceptions_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        # Skip empty lines and comments
-                        if line and not line.startswith("#"):
-                            self._exception_patterns.append(line)
-                logger.debug(f"Loaded {len(self._exception_patterns)} exception patterns")
+                # One read and decode of the whole file, then a C-level line split
+                self._add_exception_lines(Path(source).read_text(encoding="utf-8").splitlines())
             except Exception as e:
-                logger.warning(f"Could not load exceptions file {self.exceptions_file}: {e}")
+                logger.warning(f"Could not load exceptions file {source}: {e}")
+
+        # Lowercase once; duplicates add nothing to a substring search
+        self._exception_patterns_lower = tuple(
+            dict.fromkeys(pattern.lower() for pattern in self._exception_patterns)
+        )
+        # All patterns as one alternation, so a lookup is a single regex scan of the word
+        # rather than one substring search per pattern
+        self._exception_regex: Pattern[str] | None = (
+            re.compile("|".join(map(re.escape, self._exception_patterns_lower)))
+            if self._exception_patterns_lower
+            else None
+        )
+
+    def _add_exception_lines(self, lines: Iterable[str]) -> None:
+        """Append exception patterns from lines, skipping blanks and # comments."""
+        for line in lines:
+            line = line.strip()
+            # Skip empty lines and comments
+            if line and not line.startswith("#"):
+                self._exception_patterns.append(line)
+        logger.debug(f"Loaded {len(self._exception_patterns)} exception patterns")
+
+    def reset(self) -> None:
+        """Clear per-instance caches so a shared healer starts from a clean state."""
+        self._check_exceptions_cached.cache_clear()
+        self._heal_cached.cache_clear()
 
     def check_exceptions(self, word: str) -> bool:
         """
@@ -95,15 +351,18 @@ class WordHealer:
         Returns:
             True if word matches an exception pattern (should NOT be repaired)
         """
-        if not self._exception_patterns:
+        if self._exception_regex is None:
             return False
+        return self._check_exceptions_cached(word)
 
-        word_lower = word.lower()
-        for pattern in self._exception_patterns:
-            # Simple substring match (can be extended to regex if needed)
-            if pattern.lower() in word_lower or word_lower.startswith(pattern.lower()):
-                return True
-        return False
+    def _match_exceptions(self, word: str) -> bool:
+        """Uncached exception lookup behind check_exceptions."""
+        regex = self._exception_regex
+        if regex is None:
+            return False
+        # Simple substring match: does any pattern occur in the lowercased word
+        # (a prefix match is a substring match too)
+        return regex.search(word.lower()) is not None
 
     def protect_word_boundaries(self, text: str) -> str:
         """
@@ -119,8 +378,7 @@ class WordHealer:
             Text with word boundaries marked
         """
         # Replace 2+ spaces with [[BLOCK]] marker
-        text = _MULTI_SPACE_PATTERN.sub(f" {WORD_BLOCK_MARKER} ", text)
-        return text
+        return _MULTI_SPACE_PATTERN.sub(_BLOCK_REPLACEMENT, text)
 
     def restore_word_boundaries(self, text: str) -> str:
         """
@@ -134,22 +392,30 @@ class WordHealer:
         Returns:
             Text with boundaries restored
         """
+        text = self._strip_markers(text)
+        # Normalize multiple spaces to single space
+        text = _WHITESPACE_PATTERN.sub(" ", text)
+        return text
+
+    def _strip_markers(self, text: str) -> str:
+        """Remove [[BLOCK]] and legacy __WORD_BOUNDARY__ markers, leaving their spaces."""
         # Replace [[BLOCK]] marker with single space
         text = text.replace(WORD_BLOCK_MARKER, "")
         # Replace old __WORD_BOUNDARY__ marker for backward compatibility
-        text = text.replace(WORD_BOUNDARY_MARKER, "")
-        # Normalize multiple spaces to single space
-        text = _WHITESPACE_PATTERN.sub(" ", text)
+        if WORD_BOUNDARY_MARKER in text:
+            text = text.replace(WORD_BOUNDARY_MARKER, "")
         return text
 
-    def _has_nearby_digits(self, position: int, text: str, max_distance: int = 2) -> bool:
+    def _has_nearby_digits(
+        self, position: int, text: str, max_distance: int = _NEARBY_DIGIT_DISTANCE
+    ) -> bool:
         """
         Check for digits near a position (ignoring spaces).
 
         Args:
             position: Position to check around
             text: Text to analyze
-            max_distance: Maximum distance to search (default 2)
+            max_distance: Maximum distance to search (default _NEARBY_DIGIT_DISTANCE)
 
         Returns:
             True if nearby digits are found
@@ -205,7 +471,7 @@ class WordHealer:
             return True
 
         # Category A: Numbers with separators -> protect
-        if any(sep in matched_text for sep in ["-", ".", "/"]):
+        if not _NUMERIC_SEPARATORS.isdisjoint(matched_text):
             return True
 
         # Single digit case
@@ -224,7 +490,7 @@ class WordHealer:
             # For single "6" or "8", check if part of numeric context
             if digit_char in ("6", "8"):
                 # Check for nearby digits (within 2 chars, ignoring spaces)
-                if self._has_nearby_digits(start_pos, text, max_distance=2):
+                if self._has_nearby_digits(start_pos, text):
                     # Has nearby digits -> part of number -> protect
                     return True
                 # No nearby digits -> allow normalization (don't protect)
@@ -236,30 +502,6 @@ class WordHealer:
         # Default: protect (should not reach here)
         return True
 
-    def _collect_marker_positions(self, text: str) -> Set[int]:
-        """
-        Collect positions of word boundary markers to prevent normalization.
-
-        Args:
-            text: Text to analyze
-
-        Returns:
-            Set of protected positions covering all marker characters
-        """
-        protected: Set[int] = set()
-        for marker in (WORD_BLOCK_MARKER, WORD_BOUNDARY_MARKER):
-            if not marker:
-                continue
-            start = 0
-            marker_len = len(marker)
-            while start < len(text):
-                idx = text.find(marker, start)
-                if idx == -1:
-                    break
-                protected.update(range(idx, idx + marker_len))
-                start = idx + marker_len
-        return protected
-
     def smart_normalize(self, text: str) -> str:
         """
         Normalize OCR character errors BEFORE word repair.
@@ -276,72 +518,44 @@ class WordHealer:
         Returns:
             Text with normalized characters
         """
-        # First, identify all numeric sequences
-        # Pattern matches numbers, dates, phone numbers, ISBN, etc.
-        numeric_matches = list(_NUMERIC_PATTERN.finditer(text))
-
-        # Create a set of protected character positions
-        # Only protect matches that are classified as "should protect"
-        protected_positions: Set[int] = self._collect_marker_positions(text)
-        for match in numeric_matches:
-            if self._classify_numeric_match(match, text):
+        # Single pass over the text finds boundary markers (always protected),
+        # numeric sequences (dates, phone numbers, ISBN, etc.) and normalization candidates
+        protected_positions: set[int] = set()
+        candidates: dict[str, list[int]] = {}
+        for match in _NORMALIZE_SCAN_PATTERN.finditer(text):
+            kind = match.lastgroup
+            if kind == "candidate":
+                candidates.setdefault(match.group(0), []).append(match.start())
+            elif kind == "marker" or self._classify_numeric_match(match, text):
                 # Add all positions from this match to protected set
                 protected_positions.update(range(match.start(), match.end()))
+            else:
+                # Unprotected numeric match (lone 6/8): its digits may still be normalized
+                for i in range(match.start(), match.end()):
+                    if text[i] in SAKHA_NORMALIZATION_MAP:
+                        candidates.setdefault(text[i], []).append(i)
+
+        # Nothing to normalize: skip the character list round-trip entirely
+        if not candidates:
+            return text
 
         # Apply normalization for each character in the map
         result_chars = list(text)
+        text_length = len(result_chars)
 
+        # Characters are processed in map order, so earlier replacements provide
+        # Cyrillic context for later ones
         for wrong_char, correct_char in SAKHA_NORMALIZATION_MAP.items():
-            # Find all occurrences of wrong_char
-            for i, char in enumerate(result_chars):
-                if char == wrong_char and i not in protected_positions:
-                    # Check if surrounded by Cyrillic letters (with optional spaces)
-                    # Look before and after, skipping spaces and stopping at punctuation
-                    before_match = False
-                    after_match = False
-
-                    # Check before (look back up to 5 chars, skipping spaces)
-                    # Stop if we hit punctuation (.,;:!?) - not a valid context
-                    chars_checked = 0
-                    for j in range(i - 1, -1, -1):
-                        if j < 0 or j >= len(result_chars):
-                            break
-                        check_char = result_chars[j]
-                        # Stop at punctuation (not a valid context for normalization)
-                        if check_char in ".,;:!?":
-                            break
-                        if check_char.isspace():
-                            continue  # Skip spaces
-                        if _CYRILLIC_PATTERN.match(check_char):
-                            before_match = True
-                            break
-                        chars_checked += 1
-                        if chars_checked >= 5:
-                            break
-
-                    # Check after (look ahead up to 5 chars, skipping spaces)
-                    # Stop if we hit punctuation (.,;:!?) - not a valid context
-                    chars_checked = 0
-                    for j in range(i + 1, len(result_chars)):
-                        check_char = result_chars[j]
-                        # Stop at punctuation (not a valid context for normalization)
-                        if check_char in ".,;:!?":
-                            break
-                        if check_char.isspace():
-                            continue  # Skip spaces
-                        if _CYRILLIC_PATTERN.match(check_char):
-                            after_match = True
-                            break
-                        chars_checked += 1
-                        if chars_checked >= 5:
-                            break
-
-                    # Replace if in Cyrillic context (need at least one Cyrillic letter nearby)
-                    if before_match or after_match:
-                        result_chars[i] = correct_char
-                        logger.debug(
-                            f"Normalized '{wrong_char}' -> '{correct_char}' at position {i}"
-                        )
+            # Visit the unprotected occurrences of wrong_char found by the scan
+            for i in candidates.get(wrong_char, ()):
+                # Replace if in Cyrillic context (need at least one Cyrillic letter nearby,
+                # looking back first and ahead only if needed)
+                if i not in protected_positions and (
+                    _has_cyrillic_context(result_chars, range(i - 1, -1, -1))
+                    or _has_cyrillic_context(result_chars, range(i + 1, text_length))
+                ):
+                    result_chars[i] = correct_char
+                    logger.debug(f"Normalized '{wrong_char}' -> '{correct_char}' at position {i}")
 
         return "".join(result_chars)
 
@@ -357,33 +571,6 @@ class WordHealer:
         """
         return char in SAKHA_VOWELS
 
-    def _count_consonants_in_sequence(self, text: str, start_pos: int) -> int:
-        """
-        Count consecutive consonants starting from a position.
-
-        Args:
-            text: Text to analyze
-            start_pos: Starting position
-
-        Returns:
-            Number of consecutive consonants
-        """
-        count = 0
-
-        for i in range(start_pos, len(text)):
-            char = text[i]
-            # Only count Cyrillic letters (not spaces, punctuation, etc.)
-            if _CYRILLIC_PATTERN.match(char):
-                if not self._is_vowel(char):
-                    count += 1
-                else:
-                    break  # Stop at first vowel
-            else:
-                # Non-letter character - stop counting
-                break
-
-        return count
-
     def _check_phonetic_validity(self, word: str) -> bool:
         """
         Check if word has valid phonetics (not too many consecutive consonants).
@@ -394,13 +581,9 @@ class WordHealer:
         Returns:
             True if word has valid phonetics (no 10+ consecutive consonants)
         """
-        for i in range(len(word)):
-            consonant_count = self._count_consonants_in_sequence(word, i)
-            if consonant_count >= MAX_CONSONANT_SEQUENCE:
-                logger.debug(
-                    f"Phonetic check failed: {consonant_count} consecutive consonants in '{word}'"
-                )
-                return False
+        if not _has_valid_consonant_runs(word):
+            logger.debug(f"Phonetic check failed: too many consecutive consonants in '{word}'")
+            return False
         return True
 
     def _check_length_validity(self, word: str) -> bool:
@@ -415,15 +598,69 @@ class WordHealer:
         Returns:
             True if word length is valid (<= 25) or contains Sakha anchor characters
         """
+        # Short words pass without looking at their characters
+        if len(word) <= MAX_WORD_LENGTH:
+            return True
+
         # Bypass length check if word contains Sakha anchor characters
-        if any(char in word for char in SAKHA_ANCHOR_CHARS):
+        if _has_sakha(word):
             return True
 
-        if len(word) > MAX_WORD_LENGTH:
-            logger.debug(f"Length check failed: word '{word}' exceeds {MAX_WORD_LENGTH} characters")
-            return False
+        logger.debug(f"Length check failed: word '{word}' exceeds {MAX_WORD_LENGTH} characters")
+        return False
 
-        return True
+    def _merge_with_validation(self, match: Match[str]) -> str:
+        """
+        Merge two adjacent Cyrillic sequences matched by the strict merge pattern.
+
+        Everything needed is on the match itself, so one bound method serves
+        every pass instead of a closure rebuilt per pass.
+
+        Args:
+            match: Match of _STRICT_MERGE_PATTERN against the current block text
+
+        Returns:
+            Merged characters, or the original match text if the merge is rejected
+        """
+        char1, char2 = match.groups()
+
+        # Only merge if at least one part is a single character.
+        # If both parts are multi-character words, it's likely a missing space.
+        # EXCEPTION: Allow merging if the combined length is short (e.g. <= 6 chars)
+        # This allows repairing "са ха" -> "саха" (2+2) and "оҕол ор" -> "оҕолор" (4+2)
+        # but prevents "саха тыла" (4+4=8)
+        if (
+            len(char1) > 1
+            and len(char2) > 1
+            and len(char1) + len(char2) > _MAX_MULTI_CHAR_MERGE_LENGTH
+        ):
+            return match.group(0)
+
+        # No neighbour check is needed: both groups are greedy and the match is leftmost,
+        # so the characters just before and after the match are never Cyrillic and the
+        # merge cannot glue onto a longer word
+
+        # Check if there are multiple spaces between the sequences (word boundary)
+        # This prevents merging separate words like "саха тыла"
+        gap = match.string[match.end(1) : match.start(2)]
+        if "  " in gap or "\n" in gap:
+            # Multiple spaces or newline indicates word boundary, don't merge
+            return match.group(0)
+
+        # The word formed by the merge is exactly the two matched sequences joined together
+        merged_chars = char1 + char2
+
+        # Check validity
+        if not self._check_length_validity(merged_chars):
+            logger.debug(f"Rollback: length check failed for '{merged_chars}'")
+            return match.group(0)  # Don't merge - return original
+
+        if not self._check_phonetic_validity(merged_chars):
+            logger.debug(f"Rollback: phonetic check failed for '{merged_chars}'")
+            return match.group(0)  # Don't merge - return original
+
+        # Merge is valid - return merged chars (char2 was consumed by pattern, so no duplication)
+        return merged_chars
 
     def repair_broken_words(self, text: str, max_passes: Optional[int] = None) -> str:
         """
@@ -458,110 +695,8 @@ class WordHealer:
             for pass_num in range(max_passes):
                 last_pass_num = pass_num
 
-                def create_merge_function(current_block_text: str):
-                    """Create a merge function that captures block_text explicitly."""
-                    def merge_with_validation(match: Match[str]) -> str:
-                        """Merge single characters with validation."""
-                        char1 = match.group(1)
-                        char2 = match.group(2)
-
-                        # Only merge if at least one part is a single character.
-                        # If both parts are multi-character words, it's likely a missing space.
-                        # EXCEPTION: Allow merging if the combined length is short (e.g. <= 6 chars)
-                        # This allows repairing "са ха" -> "саха" (2+2) and "оҕол ор" -> "оҕолор" (4+2)
-                        # but prevents "саха тыла" (4+4=8)
-                        if len(char1) > 1 and len(char2) > 1 and len(char1 + char2) > 7:
-                            return match.group(0)
-
-                        # Get the position in the current block_text
-                        match_start = match.start()
-                        match_end = match.end()
-
-                        # Check if we're merging separate words (should not merge)
-                        # Look backwards: if there's a non-space char immediately before seq1, it's part of a longer word
-                        if match_start > 0:
-                            prev_char = current_block_text[match_start - 1]
-                            if not prev_char.isspace() and _CYRILLIC_PATTERN.match(prev_char):
-                                # seq1 is part of a longer word (not separated by space), don't merge
-                                return match.group(0)
-
-                        # Look forwards: if there's a non-space char immediately after seq2, it's part of a longer word
-                        if match_end < len(current_block_text):
-                            next_char = current_block_text[match_end]
-                            if not next_char.isspace() and _CYRILLIC_PATTERN.match(next_char):
-                                # seq2 is part of a longer word (not separated by space), don't merge
-                                return match.group(0)
-                        
-                        # Check if there are multiple spaces between the sequences (word boundary)
-                        # This prevents merging separate words like "саха тыла"
-                        match_text = current_block_text[match_start:match_end]
-                        if "  " in match_text or "\n" in match_text:
-                            # Multiple spaces or newline indicates word boundary, don't merge
-                            return match.group(0)
-
-                        # Find word boundaries: look for the full word that would contain this merge
-                        # Look backwards for word start (stop at space or non-Cyrillic)
-                        word_start = match_start
-                        for i in range(match_start - 1, -1, -1):
-                            if i < len(current_block_text):
-                                char = current_block_text[i]
-                                if char.isspace():
-                                    break  # Stop at space (word boundary)
-                                if _CYRILLIC_PATTERN.match(char):
-                                    word_start = i
-                                else:
-                                    break  # Stop at non-Cyrillic
-
-                        # Look forwards for word end (stop at space or non-Cyrillic)
-                        word_end = match_end
-                        for i in range(match_end, len(current_block_text)):
-                            if i < len(current_block_text):
-                                char = current_block_text[i]
-                                if char.isspace():
-                                    break  # Stop at space (word boundary)
-                                if _CYRILLIC_PATTERN.match(char):
-                                    word_end = i + 1
-                                else:
-                                    break  # Stop at non-Cyrillic
-
-                        # Simulate the merge: replace the matched pattern with merged chars
-                        # The match consumed: char1 + spaces + char2
-                        # We want to replace it with: char1 + char2 (no spaces)
-                        merged_chars = char1 + char2
-                        # Build the potential word with the merge applied
-                        potential_word_with_spaces = (
-                            current_block_text[word_start:match_start]
-                            + merged_chars
-                            + current_block_text[match_end:word_end]
-                        )
-
-                        # Remove all spaces to get the clean word for validation
-                        potential_word_clean = re.sub(r"\s+", "", potential_word_with_spaces)
-
-                        # Skip validation if word is empty or too short
-                        if len(potential_word_clean) <= 1:
-                            return merged_chars
-
-                        # Check validity
-                        if not self._check_length_validity(potential_word_clean):
-                            logger.debug(f"Rollback: length check failed for '{potential_word_clean}'")
-                            return match.group(0)  # Don't merge - return original
-
-                        if not self._check_phonetic_validity(potential_word_clean):
-                            logger.debug(
-                                f"Rollback: phonetic check failed for '{potential_word_clean}'"
-                            )
-                            return match.group(0)  # Don't merge - return original
-
-                        # Merge is valid - return merged chars (char2 was consumed by pattern, so no duplication)
-                        return merged_chars
-
-                    return merge_with_validation
-
                 # Apply strict merge pattern with validation
-                block_text = _STRICT_MERGE_PATTERN.sub(
-                    create_merge_function(block_text), block_text
-                )
+                block_text = _STRICT_MERGE_PATTERN.sub(self._merge_with_validation, block_text)
 
                 current_length = len(block_text)
 
@@ -596,26 +731,13 @@ class WordHealer:
         Returns:
             Text with false hyphens removed, legitimate hyphens preserved
         """
+        # Every candidate contains a literal hyphen-newline; skip the regex without one
+        if "-\n" not in text:
+            return text
+
         # Pattern: word-hyphen-newline(s)-word (line break artifact)
         # Only merge if both parts contain Sakha/Cyrillic characters
-
-        def should_merge(match) -> bool:
-            part1, part2 = match.groups()
-            # Check if both parts contain Cyrillic characters (broader than just Sakha anchors)
-            has_cyrillic1 = _CYRILLIC_PATTERN.search(part1) is not None
-            has_cyrillic2 = _CYRILLIC_PATTERN.search(part2) is not None
-
-            # Only merge if both parts contain Cyrillic (likely a broken Sakha word)
-            return bool(has_cyrillic1 and has_cyrillic2)
-
-        def replace_hyphen(match: Match[str]) -> str:
-            if should_merge(match):
-                # Merge directly without hyphen or space (it's one word split across lines)
-                return match.group(1) + match.group(2)
-            return match.group(0)  # Keep original
-
-        text = _FALSE_HYPHEN_PATTERN.sub(replace_hyphen, text)
-        return text
+        return _FALSE_HYPHEN_PATTERN.sub(_merge_false_hyphen, text)
 
     def heal_text(self, text: str) -> str:
         """
@@ -629,39 +751,170 @@ class WordHealer:
         5. Restore word boundaries
         6. Final cleanup
 
+        Healing is deterministic for a given text and pass count, so texts of up to
+        _HEAL_CACHE_MAX_TEXT_LENGTH characters are memoized per healer. The memo keeps
+        up to _HEAL_CACHE_SIZE inputs and results alive for the life of the healer, and
+        because it refers back to the healer, both are freed by the cyclic garbage
+        collector rather than on the last reference; call reset() to drop it early.
+
         Args:
             text: Input text with OCR errors
 
         Returns:
             Healed text
         """
-        if not config.word_healer_enabled:
+        # Read config once per call; the pipeline below only sees the locals
+        enabled = config.word_healer_enabled
+        max_passes = config.word_healer_passes
+        if not enabled:
             return text
 
-        original_length = len(text)
+        # Short texts (lines, test strings) use the memo; long documents bypass it
+        if len(text) <= _HEAL_CACHE_MAX_TEXT_LENGTH:
+            healed = self._heal_cached(text, max_passes)
+        else:
+            healed = self._heal(text, max_passes)
+        _log_length_change(text, healed)
+        return healed
 
-        # Step 1: Protect word boundaries (mark double spaces)
-        text = self.protect_word_boundaries(text)
-
-        # Step 2: Smart normalize (fix character hallucinations)
-        text = self.smart_normalize(text)
+    def heal_text_batch(self, texts: list[str]) -> list[str]:
+        """
+        Heal many texts with one run of the pipeline.
 
-        # Step 3: Repair broken words (merge single letters)
-        # Note: Exception checking is done per-word during repair if needed
-        text = self.repair_broken_words(text)
+        Texts are joined with a comma-delimited private-use separator that no healing
+        step merges or looks across, healed together, and split back, so each result
+        matches heal_text.
 
-        # Step 4: Remove false hyphens
-        text = self.remove_false_hyphens(text)
+        Args:
+            texts: Input texts with OCR errors
 
-        # Step 5: Restore word boundaries
-        text = self.restore_word_boundaries(text)
+        Returns:
+            Healed texts, in input order
+        """
+        # Read config once per call; the pipeline below only sees the locals
+        enabled = config.word_healer_enabled
+        max_passes = config.word_healer_passes
+        if not enabled:
+            return list(texts)
+        healed = self._heal_batch(texts, max_passes)
+        for text, healed_text in zip(texts, healed):
+            _log_length_change(text, healed_text)
+        return healed
+
+    def heal_texts(
+        self, texts: Iterable[str], chunk_size: int = 1024, workers: int | None = None
+    ) -> Iterator[str]:
+        """
+        Heal a large stream of texts in parallel worker processes.
 
-        # Step 6: Final cleanup (strip, normalize spaces)
-        text = " ".join(text.split())
-        text = text.strip()
+        Texts are sent to the workers in chunks of chunk_size, and each worker
+        builds its own healer once with this healer's loaded exception patterns and
+        heals the texts of a chunk one by one. At most
+        two chunks per worker are in flight, so the input is read only as fast as
+        the results are consumed.
 
-        final_length = len(text)
-        if original_length != final_length:
-            logger.debug(f"Word healing: {original_length} -> {final_length} chars")
+        Args:
+            texts: Input texts with OCR errors
+            chunk_size: Number of texts sent to a worker at a time
+            workers: Number of worker processes (defaults to the CPU count)
 
-        return text
+        Yields:
+            Healed texts, in input order
+        """
+        # Read config once per call; workers get the values instead of their own config
+        enabled = config.word_healer_enabled
+        max_passes = config.word_healer_passes
+        if not enabled:
+            yield from texts
+            return
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            # Built-in exceptions come first; workers add their own copy of those
+            initargs=(self._exception_patterns[len(WORD_HEALER_EXCEPTIONS) :], max_passes),
+        ) as executor:
+            # Submit chunks as results are taken (executor.map would drain the input first)
+            pending: deque[Future[list[str]]] = deque()
+            for chunk in _chunked(texts, chunk_size):
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+                pending.append(executor.submit(_heal_chunk, chunk))
+            while pending:
+                yield from pending.popleft().result()
+
+    def _heal_batch(self, texts: list[str], max_passes: int) -> list[str]:
+        """Heal texts as one joined run of the pipeline (config already read)."""
+        if not texts:
+            return []
+
+        # A text that already contains the batch mark cannot be split back reliably
+        if any(_BATCH_MARK in text for text in texts):
+            return [self._heal(text, max_passes) for text in texts]
+
+        healed = self._heal(_BATCH_SEPARATOR.join(texts), max_passes)
+        return [part.strip() for part in healed.split(_BATCH_SEPARATOR)]
+
+    def _heal(self, text: str, max_passes: int) -> str:
+        """Run the healing pipeline behind heal_text (uncached)."""
+        # Normalization, repair and hyphen removal all need Cyrillic letters and one of
+        # their candidates; without them only the marker removal and whitespace cleanup
+        # below can change the text
+        if (
+            not text.isascii()
+            and _CYRILLIC_PATTERN.search(text)
+            and _HEALING_CANDIDATE_PATTERN.search(text)
+        ):
+            # Step 1: Protect word boundaries (mark double spaces)
+            text = self.protect_word_boundaries(text)
+
+            # Step 2: Smart normalize (fix character hallucinations)
+            text = self.smart_normalize(text)
+
+            # Step 3: Repair broken words (merge single letters)
+            # Note: Exception checking is done per-word during repair if needed
+            text = self.repair_broken_words(text, max_passes)
+
+            # Step 4: Remove false hyphens
+            text = self.remove_false_hyphens(text)
+
+        # Steps 5-6: Restore word boundaries and clean up; one split/join both
+        # collapses the spaces left by the markers and strips the ends
+        return " ".join(self._strip_markers(text).split())
+
+
+def _log_length_change(text: str, healed: str) -> None:
+    """Debug-log how much healing changed the length of a text."""
+    if len(text) != len(healed):
+        logger.debug(f"Word healing: {len(text)} -> {len(healed)} chars")
+
+
+# Healer and pass count of a heal_texts worker process, set by _init_worker
+_worker_healer: WordHealer | None = None
+_worker_max_passes = 0
+
+
+def _init_worker(exception_patterns: list[str], max_passes: int) -> None:
+    """Build the worker's healer once, so each chunk only pickles its texts."""
+    global _worker_healer, _worker_max_passes
+    # An iterator is always truthy, so an empty list does not fall back to the config file
+    _worker_healer = WordHealer(iter(exception_patterns))
+    _worker_max_passes = max_passes
+
+
+def _heal_chunk(texts: list[str]) -> list[str]:
+    """Heal one chunk of texts in a worker process."""
+    healer = _worker_healer
+    if healer is None:
+        raise RuntimeError("heal_texts worker used before _init_worker")
+    return [healer._heal(text, _worker_max_passes) for text in texts]
+
+
+def _chunked(texts: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Split texts into lists of at most size items."""
+    iterator = iter(texts)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -0,0 +1,40 @@
+"""
+Shared pytest fixtures.
+"""
+
+import functools
+import os
+
+import pytest
+
+from src.language_detector import WordClassifier
+
+# Set SAQA_TEST_NO_CLASSIFIER_CACHE=1 to run every is_russian_word call uncached
+_CACHE_CLASSIFIER = not os.environ.get("SAQA_TEST_NO_CLASSIFIER_CACHE")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup() -> None:
+    """Load langdetect profiles and compile module-level regexes once per worker."""
+    import src.text_cleaner  # noqa: F401  (compiles text cleaner regex globals)
+    from src.language_detector import get_classifier
+
+    classifier = get_classifier()
+    classifier.is_russian_word("кошка")  # reaches langdetect and pymorphy layers
+    classifier.is_russian_word("баҕар")
+
+
+@pytest.fixture(scope="session")
+def classifier() -> WordClassifier:
+    """
+    WordClassifier shared by the whole session (one per xdist worker).
+
+    is_russian_word is memoized, so tests that change config between calls
+    should build their own WordClassifier instead of using this fixture.
+    """
+    wc = WordClassifier()
+    if _CACHE_CLASSIFIER:
+        wc.is_russian_word = functools.lru_cache(maxsize=2048)(  # type: ignore[method-assign]
+            wc.is_russian_word
+        )
+    return wc
@@ -9,13 +9,13 @@ from __future__ import annotations
 
 import unittest
 from pathlib import Path
-import tempfile
-import shutil
 from typing import Tuple
 import sys
 import builtins
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from src.parquet_processor import ParquetProcessor
 from src.exceptions import ParquetProcessingError, MissingFileError, ValidationError
 
@@ -57,21 +57,18 @@ class _BlockImports:
 class TestParquetOptionalDeps(unittest.TestCase):
     """Test cases for parquet processor with optional dependencies."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.source_folder = Path(self.temp_dir) / "source"
-        self.archive_folder = Path(self.temp_dir) / "archive"
-        self.output_file = Path(self.temp_dir) / "output.txt"
-        self.log_file = Path(self.temp_dir) / "log.txt"
+    @pytest.fixture(autouse=True)
+    def _temp_paths(self, tmp_path: Path) -> None:
+        """Set up test fixtures under pytest's tmp_path (cleaned up by pytest)."""
+        self.temp_dir = tmp_path
+        self.source_folder = tmp_path / "source"
+        self.archive_folder = tmp_path / "archive"
+        self.output_file = tmp_path / "output.txt"
+        self.log_file = tmp_path / "log.txt"
 
         # Create source folder
         self.source_folder.mkdir(parents=True)
 
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_processor_initializes_without_pyarrow(self) -> None:
         """Test that processor can be initialized even if pyarrow is missing."""
         # This test verifies that the processor doesn't fail on import
@@ -132,3 +129,32 @@ class TestParquetOptionalDeps(unittest.TestCase):
         with self.assertRaises(ValidationError):
             processor.extract_text_from_parquet(text_file)
 
+    def test_process_all_parquets_skips_non_parquet_entries(self) -> None:
+        """Test that only regular *.parquet files are picked up from the input folder."""
+        processor = ParquetProcessor(
+            input_folder=self.source_folder,
+            archive_folder=self.archive_folder,
+            output_file=self.output_file,
+            log_file=self.log_file,
+        )
+
+        # Neither a text file nor a directory with a .parquet suffix should be processed
+        (self.source_folder / "notes.txt").write_text("test content")
+        (self.source_folder / "nested.parquet").mkdir()
+
+        self.assertEqual(processor.process_all_parquets(), 0)
+
+    def test_process_all_parquets_matches_suffix_case_insensitively(self) -> None:
+        """Test that an upper-case .PARQUET file is picked up like a .parquet one."""
+        processor = ParquetProcessor(
+            input_folder=self.source_folder,
+            archive_folder=self.archive_folder,
+            output_file=self.output_file,
+            log_file=self.log_file,
+        )
+        parquet_file = self.source_folder / "DATA.PARQUET"
+        parquet_file.write_bytes(b"")
+
+        with patch.object(processor, "process_parquet", return_value=(0, 0)) as process_parquet:
+            self.assertEqual(processor.process_all_parquets(), 1)
+        process_parquet.assert_called_once_with(parquet_file)
@@ -4,8 +4,8 @@ Tests for pdf_processor module.
 
 import unittest
 from pathlib import Path
-import tempfile
-import shutil
+
+import pytest
 
 from src.pdf_processor import PDFProcessor
 from src.exceptions import MissingFileError, ValidationError
@@ -14,21 +14,18 @@ from src.exceptions import MissingFileError, ValidationError
 class TestPDFProcessor(unittest.TestCase):
     """Test cases for PDFProcessor class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.source_folder = Path(self.temp_dir) / "source"
-        self.archive_folder = Path(self.temp_dir) / "archive"
-        self.output_file = Path(self.temp_dir) / "output.txt"
-        self.log_file = Path(self.temp_dir) / "log.txt"
+    @pytest.fixture(autouse=True)
+    def _temp_paths(self, tmp_path: Path):
+        """Set up test fixtures under pytest's tmp_path (cleaned up by pytest)."""
+        self.temp_dir = tmp_path
+        self.source_folder = tmp_path / "source"
+        self.archive_folder = tmp_path / "archive"
+        self.output_file = tmp_path / "output.txt"
+        self.log_file = tmp_path / "log.txt"
 
         # Create source folder
         self.source_folder.mkdir(parents=True)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_processor_initialization_with_valid_folders(self):
         """Test PDFProcessor initialization with valid folders."""
         processor = PDFProcessor(
@@ -2,216 +2,380 @@
 Tests for text_cleaner module.
 """
 
-import unittest
 from pathlib import Path
-import tempfile
-import os
+from types import SimpleNamespace
 
-from src.text_cleaner import TextCleaner
+import pytest
+import regex
+from hypothesis import given, settings, strategies as st
+
+from src import language_detector
 from src.language_detector import WordClassifier
+from src.text_cleaner import TextCleaner
+from src.config import config
+from src.constants import SAKHA_ANCHOR_CHARS
 from src.exceptions import MissingFileError, ValidationError
 
 
-class TestTextCleaner(unittest.TestCase):
+@pytest.fixture
+def input_file(tmp_path: Path) -> Path:
+    """Path for the test input file (not created)."""
+    return tmp_path / "test_input.txt"
+
+
+@pytest.fixture
+def output_file(tmp_path: Path) -> Path:
+    """Path for the test output file."""
+    return tmp_path / "test_output.txt"
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    """Path for the test log file."""
+    return tmp_path / "test_log.txt"
+
+
+@pytest.fixture(scope="module")
+def cleaner(tmp_path_factory: pytest.TempPathFactory) -> TextCleaner:
+    """Single TextCleaner shared by tests that only exercise its methods."""
+    directory = tmp_path_factory.mktemp("cleaner")
+    input_path = directory / "input.txt"
+    input_path.write_bytes(b"seed")
+    return TextCleaner(
+        input_file=input_path,
+        output_file=directory / "output.txt",
+        log_file=directory / "log.txt",
+    )
+
+
+@pytest.fixture
+def cleaner_input(cleaner: TextCleaner):
+    """Rewrite the shared cleaner's input file without re-constructing it."""
+
+    def write(text: str) -> None:
+        cleaner.input_file.write_text(text, encoding="utf-8")
+
+    return write
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        # Digits and punctuation are removed
+        ("Hello123!@# World456", "Hello World"),
+        # Letters and spaces are preserved
+        ("Сахалыы тыл уонна русскай", "Сахалыы тыл уонна русскай"),
+        # Hyphens in compound words are preserved
+        ("кыра-балыста оҕолор-дьон", "кыра-балыста оҕолор-дьон"),
+        # Line-break hyphens ("-\n") are preserved for the word healer
+        ("слово-\nслово кыра-балыста", "слово-\nслово кыра-балыста"),
+    ],
+)
+def test_remove_special_characters(text, expected):
+    """Test removal of special characters (static method, no fixtures needed)."""
+    assert TextCleaner.remove_special_characters(text) == expected
+
+
+def test_remove_special_characters_uses_precompiled_pattern():
+    """Test that remove_special_characters relies on a module-level compiled regex."""
+    from src import text_cleaner
+
+    patterns = {
+        name for name, value in vars(text_cleaner).items() if isinstance(value, regex.Pattern)
+    }
+    used = set(TextCleaner.remove_special_characters.__code__.co_names)
+    assert patterns & used, "expected a module-level regex.compile in remove_special_characters"
+
+
+_SAKHA_ANCHORS = "".join(sorted(SAKHA_ANCHOR_CHARS))
+
+
+@settings(max_examples=50)
+@given(st.text(alphabet="абвгдкрст" + _SAKHA_ANCHORS, min_size=1))
+def test_has_sakha_anchor_chars_property(classifier, word):
+    """Test that anchor detection agrees with a plain membership check."""
+    assert classifier.has_sakha_anchor_chars(word) == any(c in _SAKHA_ANCHORS for c in word)
+
+
+@settings(max_examples=50)
+@given(st.text(alphabet="abcАБВабвҕүөһҥ019 \n-–_!@#.,"))
+def test_remove_special_characters_property(text):
+    """Test that only letters, spaces, newlines and hyphens survive."""
+    expected = "".join(c for c in text if c.isalpha() or c in " \n-")
+    assert TextCleaner.remove_special_characters(text) == expected
+
+
+def test_detect_language_is_memoized(monkeypatch):
+    """Test that langdetect runs once per distinct word."""
+    calls = []
+
+    class FakeDetector:
+        def append(self, text):
+            calls.append(text)
+
+        def detect(self):
+            return "ru"
+
+    monkeypatch.setattr(
+        language_detector, "_get_detector_factory", lambda: SimpleNamespace(create=FakeDetector)
+    )
+    language_detector._detect_language.cache_clear()
+    try:
+        assert language_detector._detect_language("кошка") == "ru"
+        assert language_detector._detect_language("кошка") == "ru"
+        assert calls == ["кошка"]
+    finally:
+        language_detector._detect_language.cache_clear()
+
+
+def test_is_russian_word_skips_langdetect_for_non_cyrillic(monkeypatch):
+    """Test that words without Cyrillic letters are kept without running langdetect."""
+
+    def fail(word):
+        raise AssertionError(f"langdetect called for {word!r}")
+
+    monkeypatch.setattr(language_detector, "_detect_language", fail)
+    assert WordClassifier().is_russian_word("hello") is False
+
+
+def test_sakha_and_russian_suffixes_are_disjoint():
+    """Test that no Sakha suffix ends a Russian one or vice versa, so suffix order never decides."""
+    overlaps = [
+        (sakha, russian)
+        for sakha in language_detector._SAKHA_SUFFIXES
+        for russian in language_detector._RUSSIAN_SUFFIXES
+        if sakha.endswith(russian) or russian.endswith(sakha)
+    ]
+    assert overlaps == []
+
+
+def test_is_russian_word_keeps_latin_names_without_slow_layers():
+    """Test that Latin-script words, names included, skip the names and morphology layers."""
+    classifier = WordClassifier()
+
+    def fail(word):
+        raise AssertionError(f"slow layer called for {word!r}")
+
+    # Pre-fill the lazily loaded layers with stand-ins that fail if used
+    classifier._names_extractor = fail
+    classifier._morph = SimpleNamespace(parse=fail)
+    assert classifier.is_russian_word("Ivanov") is False
+    assert classifier.is_russian_word("Pushkin") is False
+
+
+def test_is_russian_word_without_langdetect(monkeypatch):
+    """Test that config.use_langdetect=False bypasses langdetect entirely."""
+
+    def fail(word):
+        raise AssertionError(f"langdetect called for {word!r}")
+
+    monkeypatch.setattr(language_detector, "_detect_language", fail)
+    monkeypatch.setattr(config, "use_langdetect", False)
+    # Rule layers still decide; the rest falls through to morphology
+    assert WordClassifier().is_russian_word("щит") is True
+    assert WordClassifier().is_russian_word("кошки") is True  # inflected form, via pymorphy2
+
+
+def test_detect_language_is_deterministic():
+    """Test that the seeded detector factory gives the same answer on every uncached call."""
+    results = set()
+    for _ in range(5):
+        language_detector._detect_language.cache_clear()
+        results.add(language_detector._detect_language("кошка"))
+    assert len(results) == 1
+
+
+@pytest.mark.parametrize(
+    "word,expected",
+    [
+        ("баҕар", language_detector._FLAG_SAKHA_ANCHOR),
+        ("уонна", language_detector._FLAG_SAKHA_DIPHTHONG),
+        ("щит", language_detector._FLAG_RUSSIAN_MARKER),
+        ("цуо", language_detector._FLAG_SAKHA_DIPHTHONG | language_detector._FLAG_RUSSIAN_MARKER),
+        ("кошка", 0),
+    ],
+)
+def test_scan_word_flags(word, expected):
+    """Test that the fused character scan reports every applicable flag."""
+    assert language_detector._scan_word(word) == expected
+
+
+class TestTextCleaner:
     """Test cases for TextCleaner class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.input_file = Path(self.temp_dir) / "test_input.txt"
-        self.output_file = Path(self.temp_dir) / "test_output.txt"
-        self.log_file = Path(self.temp_dir) / "test_log.txt"
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_remove_special_characters(self):
-        """Test removal of special characters."""
-        text = "Hello123!@# World456"
-        result = TextCleaner.remove_special_characters(text)
-        self.assertEqual(result, "Hello World")
-
-    def test_remove_special_characters_keeps_letters_and_spaces(self):
-        """Test that letters and spaces are preserved."""
-        text = "Сахалыы тыл уонна русскай"
-        result = TextCleaner.remove_special_characters(text)
-        self.assertEqual(result, "Сахалыы тыл уонна русскай")
-
-    def test_is_russian_word_with_russian_word(self):
-        """Test detection of Russian words."""
-        classifier = WordClassifier()
-        # This test may vary based on language detection
-        # Testing with a clear Russian word
-        result = classifier.is_russian_word("привет")
-        # Should return True for Russian words
-        # Note: This may fail if langdetect doesn't recognize it
-        self.assertIsInstance(result, bool)
-
-    def test_is_russian_word_with_empty_string(self):
+    @pytest.mark.parametrize(
+        "predicate",
+        [
+            "has_sakha_anchor_chars",
+            "has_sakha_diphthongs",
+            "has_russian_marker_chars",
+            "matches_russian_patterns",
+            "matches_sakha_patterns",
+        ],
+    )
+    def test_predicates_with_empty_string(self, classifier, predicate):
+        """Test that every classifier predicate returns False for an empty string."""
+        assert getattr(classifier, predicate)("") is False
+
+    def test_is_russian_word_with_empty_string(self, classifier):
         """Test with empty string."""
-        classifier = WordClassifier()
         result = classifier.is_russian_word("")
-        self.assertFalse(result)
+        assert result is False
 
-    def test_cleaner_initialization_with_valid_file(self):
+    def test_cleaner_initialization_with_valid_file(self, input_file, output_file, log_file):
         """Test TextCleaner initialization with valid input file."""
         # Create a test input file
-        with open(self.input_file, "w", encoding="utf-8") as f:
-            f.write("Test content")
-
-        cleaner = TextCleaner(
-            input_file=self.input_file, output_file=self.output_file, log_file=self.log_file
-        )
-        self.assertEqual(cleaner.input_file, self.input_file)
-        self.assertEqual(cleaner.output_file, self.output_file)
-
-    def test_cleaner_initialization_with_missing_file(self):
-        """Test TextCleaner initialization with missing input file."""
-        with self.assertRaises(MissingFileError):
-            TextCleaner(
-                input_file=Path(self.temp_dir) / "nonexistent.txt",
-                output_file=self.output_file,
-                log_file=self.log_file,
-            )
-
-    def test_cleaner_initialization_with_empty_file(self):
-        """Test TextCleaner initialization with empty file."""
-        # Create empty file
-        self.input_file.touch()
-
-        with self.assertRaises(ValidationError):
-            TextCleaner(
-                input_file=self.input_file, output_file=self.output_file, log_file=self.log_file
-            )
-
-    def test_remove_russian_words_basic(self):
+        input_file.write_bytes(b"Test content")
+
+        cleaner = TextCleaner(input_file=input_file, output_file=output_file, log_file=log_file)
+        assert cleaner.input_file == input_file
+        assert cleaner.output_file == output_file
+        # The classifier is only looked up when word filtering needs it
+        assert "classifier" not in vars(cleaner)
+
+    @pytest.mark.parametrize(
+        "create_input,expected_error",
+        [
+            # Missing input file
+            (False, MissingFileError),
+            # Empty input file
+            (True, ValidationError),
+        ],
+        ids=["missing", "empty"],
+    )
+    def test_cleaner_initialization_errors(
+        self, input_file, output_file, log_file, create_input, expected_error
+    ):
+        """Test TextCleaner initialization with a missing or empty input file."""
+        if create_input:
+            input_file.touch()
+
+        with pytest.raises(expected_error):
+            TextCleaner(input_file=input_file, output_file=output_file, log_file=log_file)
+
+    def test_remove_russian_words_basic(self, cleaner):
         """Test basic Russian word removal."""
-        # Create a cleaner instance to test
-        with open(self.input_file, "w", encoding="utf-8") as f:
-            f.write("hello world")
-
-        cleaner = TextCleaner(
-            input_file=self.input_file, output_file=self.output_file, log_file=self.log_file
-        )
-
-        # Simple test - actual behavior depends on language detection
-        text = "hello world"
-        result = cleaner.remove_russian_words(text)  # Now an instance method
-        # Should return text with words joined by spaces
-        self.assertIsInstance(result, str)
+        # Decided by character rules alone (щ marker vs ҕ anchor), no language detection
+        assert cleaner.remove_russian_words("щит баҕар") == "баҕар"
+        assert cleaner.remove_russian_words("") == ""
 
     # Tests for Sakha anchor characters
-    def test_has_sakha_anchor_chars(self):
-        """Test detection of Sakha anchor characters."""
-        classifier = WordClassifier()
-        self.assertTrue(classifier.has_sakha_anchor_chars("баҕар"))  # Contains ҕ
-        self.assertTrue(classifier.has_sakha_anchor_chars("үөрэн"))  # Contains ү
-        self.assertTrue(classifier.has_sakha_anchor_chars("өлөр"))  # Contains ө
-        self.assertTrue(classifier.has_sakha_anchor_chars("һаһыл"))  # Contains һ
-        self.assertTrue(classifier.has_sakha_anchor_chars("ҥыһаан"))  # Contains ҥ
-        self.assertFalse(classifier.has_sakha_anchor_chars("привет"))  # No Sakha chars
-        self.assertFalse(classifier.has_sakha_anchor_chars("hello"))  # No Sakha chars
-
-    def test_is_russian_word_with_sakha_anchor(self):
+    @pytest.mark.parametrize("word", ["баҕар", "үөрэн", "өлөр", "һаһыл", "ҥыһаан"])
+    def test_has_sakha_anchor_chars(self, classifier, word):
+        """Test detection of Sakha anchor characters (ҕ, ү, ө, һ, ҥ)."""
+        assert classifier.has_sakha_anchor_chars(word)
+
+    @pytest.mark.parametrize("word", ["привет", "hello"])
+    def test_has_sakha_anchor_chars_negative(self, classifier, word):
+        """Test that words without Sakha anchor characters are not detected."""
+        assert not classifier.has_sakha_anchor_chars(word)
+
+    @pytest.mark.parametrize("word", ["баҕар", "үөрэн", "өлөр"])
+    def test_is_russian_word_with_sakha_anchor(self, classifier, word):
         """Test that words with Sakha anchor characters are kept."""
-        classifier = WordClassifier()
         # Words with Sakha anchors should NOT be identified as Russian
-        self.assertFalse(classifier.is_russian_word("баҕар"))  # Contains ҕ - should keep
-        self.assertFalse(classifier.is_russian_word("үөрэн"))  # Contains ү - should keep
-        self.assertFalse(classifier.is_russian_word("өлөр"))  # Contains ө - should keep
+        assert not classifier.is_russian_word(word)
 
     # Tests for Sakha diphthongs
-    def test_has_sakha_diphthongs(self):
-        """Test detection of Sakha diphthongs."""
-        classifier = WordClassifier()
-        self.assertTrue(classifier.has_sakha_diphthongs("уонна"))  # Contains уо
-        self.assertTrue(classifier.has_sakha_diphthongs("иэ"))  # Contains иэ
-        self.assertTrue(classifier.has_sakha_diphthongs("ыа"))  # Contains ыа
-        self.assertTrue(classifier.has_sakha_diphthongs("үө"))  # Contains үө
-        self.assertFalse(classifier.has_sakha_diphthongs("привет"))  # No diphthongs
-
-    def test_is_russian_word_with_sakha_diphthong(self):
+    @pytest.mark.parametrize("word", ["уонна", "иэ", "ыа", "үө"])
+    def test_has_sakha_diphthongs(self, classifier, word):
+        """Test detection of Sakha diphthongs (уо, иэ, ыа, үө)."""
+        assert classifier.has_sakha_diphthongs(word)
+
+    @pytest.mark.parametrize("word", ["привет"])
+    def test_has_sakha_diphthongs_negative(self, classifier, word):
+        """Test that words without Sakha diphthongs are not detected."""
+        assert not classifier.has_sakha_diphthongs(word)
+
+    def test_is_russian_word_with_sakha_diphthong(self, classifier):
         """Test that words with Sakha diphthongs are kept."""
-        classifier = WordClassifier()
-        self.assertFalse(classifier.is_russian_word("уонна"))  # Contains уо - should keep
+        assert not classifier.is_russian_word("уонна")  # Contains уо - should keep
 
     # Tests for Russian marker characters
-    def test_has_russian_marker_chars(self):
-        """Test detection of Russian marker characters."""
-        classifier = WordClassifier()
-        self.assertTrue(classifier.has_russian_marker_chars("щит"))  # Contains щ
-        self.assertTrue(classifier.has_russian_marker_chars("царь"))  # Contains ц
-        self.assertTrue(classifier.has_russian_marker_chars("объявление"))  # Contains ъ
-        self.assertTrue(classifier.has_russian_marker_chars("флаг"))  # Contains ф
-        self.assertFalse(classifier.has_russian_marker_chars("баҕар"))  # No Russian markers
-
-    def test_is_russian_word_with_russian_marker(self):
-        """Test that words with Russian markers are deleted."""
-        classifier = WordClassifier()
-        self.assertTrue(classifier.is_russian_word("щит"))  # Contains щ - should delete
-        self.assertTrue(classifier.is_russian_word("царь"))  # Contains ц - should delete
-        self.assertTrue(classifier.is_russian_word("флаг"))  # Contains ф - should delete
+    @pytest.mark.parametrize("word", ["щит", "царь", "объявление", "флаг"])
+    def test_has_russian_marker_chars(self, classifier, word):
+        """Test detection of Russian marker characters (щ, ц, ъ, ф)."""
+        assert classifier.has_russian_marker_chars(word)
+
+    @pytest.mark.parametrize("word", ["баҕар"])
+    def test_has_russian_marker_chars_negative(self, classifier, word):
+        """Test that words without Russian markers are not detected."""
+        assert not classifier.has_russian_marker_chars(word)
+
+    @pytest.mark.parametrize("use_v,expected", [(True, True), (False, False)])
+    def test_has_russian_marker_chars_v_flag(self, classifier, monkeypatch, use_v, expected):
+        """Test that 'в' only counts as a Russian marker when enabled in config."""
+        monkeypatch.setattr(config, "use_v_as_russian_marker", use_v)
+        assert classifier.has_russian_marker_chars("вода") is expected
+
+    @pytest.mark.parametrize("word", ["щит", "царь", "флаг"])
+    def test_is_russian_word_with_russian_marker(self, classifier, word):
+        """Test that words with Russian markers (щ, ц, ф) are deleted."""
+        assert classifier.is_russian_word(word)
 
     # Tests for morphological patterns
-    def test_matches_russian_patterns(self):
+    @pytest.mark.parametrize(
+        "word",
+        [
+            # Verb patterns: -тся, -ешь, -л
+            "читается",
+            "читаешь",
+            "читал",
+            # Adjective patterns: -ый, -ая, -ое
+            "красивый",
+            "красивая",
+            "красивое",
+        ],
+    )
+    def test_matches_russian_patterns(self, classifier, word):
         """Test detection of Russian morphological patterns."""
-        classifier = WordClassifier()
-        # Verb patterns
-        self.assertTrue(classifier.matches_russian_patterns("читается"))  # Ends with -ется
-        self.assertTrue(classifier.matches_russian_patterns("читается"))  # Ends with -ется
-        self.assertTrue(classifier.matches_russian_patterns("читаешь"))  # Ends with -ешь
-        self.assertTrue(classifier.matches_russian_patterns("читал"))  # Ends with -л
-
-        # Adjective patterns
-        self.assertTrue(classifier.matches_russian_patterns("красивый"))  # Ends with -ый
-        self.assertTrue(classifier.matches_russian_patterns("красивая"))  # Ends with -ая
-        self.assertTrue(classifier.matches_russian_patterns("красивое"))  # Ends with -ое
-
-        # Noun patterns - test with words that actually end with these patterns
-        # Note: We can't easily test -ость, -ение, -ание without real Russian words
-        # But the pattern matching logic should work for words that do end with these
-        self.assertFalse(classifier.matches_russian_patterns("баҕар"))  # No Russian patterns
-
-    def test_matches_sakha_patterns(self):
+        assert classifier.matches_russian_patterns(word)
+
+    @pytest.mark.parametrize("word", ["баҕар"])
+    def test_matches_russian_patterns_negative(self, classifier, word):
+        """Test that words without Russian endings are not matched."""
+        assert not classifier.matches_russian_patterns(word)
+
+    @pytest.mark.parametrize(
+        "word",
+        [
+            # Plural patterns: -лор, -лэр, -тэр
+            "оҕолор",
+            "киһилэр",
+            "киһитэр",
+            # Possessive patterns: -тэ, -та
+            "киһитэ",
+            "киһита",
+        ],
+    )
+    def test_matches_sakha_patterns(self, classifier, word):
         """Test detection of Sakha morphological patterns."""
-        classifier = WordClassifier()
-        # Plural patterns
-        self.assertTrue(classifier.matches_sakha_patterns("оҕолор"))  # Ends with -лор
-        self.assertTrue(classifier.matches_sakha_patterns("киһилэр"))  # Ends with -лэр
-        self.assertTrue(classifier.matches_sakha_patterns("киһитэр"))  # Ends with -тэр
-
-        # Possessive patterns
-        self.assertTrue(classifier.matches_sakha_patterns("киһитэ"))  # Ends with -тэ
-        self.assertTrue(classifier.matches_sakha_patterns("киһита"))  # Ends with -та
-        self.assertFalse(classifier.matches_sakha_patterns("привет"))  # No Sakha patterns
-
-    def test_is_russian_word_with_russian_patterns(self):
-        """Test that words with Russian patterns are deleted."""
-        classifier = WordClassifier()
-        self.assertTrue(classifier.is_russian_word("читается"))  # Russian verb pattern
-        self.assertTrue(classifier.is_russian_word("красивый"))  # Russian adjective pattern
-
-    def test_is_russian_word_with_sakha_patterns(self):
-        """Test that words with Sakha patterns are kept."""
-        classifier = WordClassifier()
-        self.assertFalse(classifier.is_russian_word("оҕолор"))  # Sakha plural pattern - should keep
-        self.assertFalse(
-            classifier.is_russian_word("киһитэ")
-        )  # Sakha possessive pattern - should keep
+        assert classifier.matches_sakha_patterns(word)
+
+    @pytest.mark.parametrize("word", ["привет"])
+    def test_matches_sakha_patterns_negative(self, classifier, word):
+        """Test that words without Sakha endings are not matched."""
+        assert not classifier.matches_sakha_patterns(word)
+
+    @pytest.mark.parametrize("word", ["читается", "красивый"])
+    def test_is_russian_word_with_russian_patterns(self, classifier, word):
+        """Test that words with Russian verb/adjective patterns are deleted."""
+        assert classifier.is_russian_word(word)
+
+    @pytest.mark.parametrize("word", ["оҕолор", "киһитэ"])
+    def test_is_russian_word_with_sakha_patterns(self, classifier, word):
+        """Test that words with Sakha plural/possessive patterns are kept."""
+        assert not classifier.is_russian_word(word)
 
     # Tests for combination of rules
-    def test_priority_sakha_anchor_over_russian_marker(self):
+    def test_priority_sakha_anchor_over_russian_marker(self, classifier):
         """Test that Sakha anchors have priority over Russian markers."""
-        classifier = WordClassifier()
         # Word with both Sakha anchor and Russian marker should be kept (Sakha anchor wins)
         # Note: This is a theoretical test - in practice, such words are rare
         # But if they exist, Sakha anchor should win
         word_with_both = "баҕар"  # Has ҕ (Sakha anchor)
         # This word doesn't have Russian markers, but if it did, anchor should win
-        self.assertFalse(classifier.is_russian_word(word_with_both))  # Should keep
+        assert not classifier.is_russian_word(word_with_both)  # Should keep
 
     def test_priority_sakha_pattern_over_russian_pattern(self):
         """Test that Sakha patterns have priority over Russian patterns."""
@@ -219,130 +383,93 @@ class TestTextCleaner(unittest.TestCase):
         # This is handled by checking Sakha patterns first in the code
         pass  # Hard to create realistic test case
 
-    def test_remove_russian_words_with_sakha_words(self):
+    def test_remove_russian_words_with_sakha_words(self, cleaner):
         """Test removal of Russian words while preserving Sakha words."""
-        # Create a cleaner instance to test
-        with open(self.input_file, "w", encoding="utf-8") as f:
-            f.write("баҕар үөрэн уонна привет читается")
-
-        cleaner = TextCleaner(
-            input_file=self.input_file, output_file=self.output_file, log_file=self.log_file
-        )
-
         text = "баҕар үөрэн уонна привет читается"
         result = cleaner.remove_russian_words(text)
         # Should keep Sakha words, remove Russian words
         # Exact result depends on language detection, but Sakha words should be preserved
-        self.assertIn("баҕар", result)  # Sakha word with anchor
-        self.assertIn("үөрэн", result)  # Sakha word with anchor
-        self.assertIn("уонна", result)  # Sakha word with diphthong
+        # баҕар/үөрэн carry anchors, уонна carries a diphthong
+        assert {"баҕар", "үөрэн", "уонна"} <= set(result.split())
 
-    # Hyphen handling tests
-    def test_remove_special_characters_preserves_hyphens(self):
-        """Test that hyphens are preserved by remove_special_characters."""
-        text = "кыра-балыста оҕолор-дьон"
-        result = TextCleaner.remove_special_characters(text)
-        # Should keep hyphens
-        self.assertIn("-", result)
-        self.assertIn("кыра-балыста", result)
-        self.assertIn("оҕолор-дьон", result)
-
-    def test_remove_special_characters_preserves_newlines_and_hyphens(self):
-        """Test that both newlines and hyphens are preserved together."""
-        text = "слово-\nслово кыра-балыста"
-        result = TextCleaner.remove_special_characters(text)
-        # Should keep both hyphens and newlines
-        self.assertIn("-", result)
-        self.assertIn("\n", result)
-        # Original pattern should be preserved
-        self.assertIn("-\n", result)
-
-    def test_remove_russian_words_preserves_legitimate_hyphens(self):
-        """Test that legitimate hyphens are preserved in non-Russian words."""
-        with open(self.input_file, "w", encoding="utf-8") as f:
-            f.write("кыра-балыста")
+    def test_classify_many(self, classifier):
+        """Test batch classification returns one verdict per distinct word, in order."""
+        verdicts = classifier.classify_many(["баҕар", "щит", "баҕар", "уонна"])
+        assert verdicts == {"баҕар": False, "щит": True, "уонна": False}
+        assert list(verdicts) == ["баҕар", "щит", "уонна"]
+
+    def test_remove_russian_words_classifies_each_word_once(self, cleaner, monkeypatch):
+        """Test that repeated words are classified once and keep their order."""
+        calls = []
+
+        def is_russian_word(word):
+            calls.append(word)
+            return word == "щит"
 
-        cleaner = TextCleaner(
-            input_file=self.input_file, output_file=self.output_file, log_file=self.log_file
-        )
+        monkeypatch.setattr(cleaner.classifier, "is_russian_word", is_russian_word)
+        result = cleaner.remove_russian_words("баҕар щит баҕар уонна щит баҕар")
+        assert result == "баҕар баҕар уонна баҕар"
+        assert sorted(calls) == ["баҕар", "уонна", "щит"]
 
+    # Hyphen handling tests
+    def test_remove_russian_words_preserves_legitimate_hyphens(self, cleaner):
+        """Test that legitimate hyphens are preserved in non-Russian words."""
         text = "кыра-балыста"
         result = cleaner.remove_russian_words(text)
         # Should preserve the hyphen in compound word
-        self.assertIn("кыра-балыста", result)
+        assert "кыра-балыста" in result.split()
 
-    def test_remove_russian_words_removes_other_separators(self):
+    def test_remove_russian_words_removes_other_separators(self, cleaner):
         """Test that en-dashes, underscores, and newlines are replaced with spaces."""
-        with open(self.input_file, "w", encoding="utf-8") as f:
-            f.write("test")
-
-        cleaner = TextCleaner(
-            input_file=self.input_file, output_file=self.output_file, log_file=self.log_file
-        )
-
         # Test with various separators (not hyphens)
         text_with_endash = "оҕо–лор"  # en-dash
         result_endash = cleaner.remove_russian_words(text_with_endash)
         # Should replace en-dash with space
-        self.assertNotIn("–", result_endash)
+        assert "–" not in result_endash
 
         text_with_underscore = "оҕо_лор"  # underscore
         result_underscore = cleaner.remove_russian_words(text_with_underscore)
         # Should replace underscore with space
-        self.assertNotIn("_", result_underscore)
+        assert "_" not in result_underscore
 
         text_with_newline = "оҕо\nлор"  # newline
         result_newline = cleaner.remove_russian_words(text_with_newline)
         # Should replace newline with space
-        self.assertNotIn("\n", result_newline)
+        assert "\n" not in result_newline
 
-    def test_hyphenated_compound_word_end_to_end(self):
+    @pytest.mark.slow
+    def test_hyphenated_compound_word_end_to_end(self, cleaner, cleaner_input):
         """Test that hyphenated compound words survive the full cleaning pipeline."""
         # Write test input
         test_text = "123кыра-балыста456 оҕолор!!! привет"
-        with open(self.input_file, "w", encoding="utf-8") as f:
-            f.write(test_text)
-
-        cleaner = TextCleaner(
-            input_file=self.input_file, output_file=self.output_file, log_file=self.log_file
-        )
+        cleaner_input(test_text)
 
         # Run the full cleaning process
         cleaner.clean_text()
 
         # Read the output
-        with open(self.output_file, "r", encoding="utf-8") as f:
-            result = f.read()
+        result = cleaner.output_file.read_text(encoding="utf-8")
 
         # Should contain the hyphenated Sakha word (if it's not detected as Russian)
         # Note: The exact result depends on language detection
         # At minimum, hyphen should not be converted to space if word is kept
         if "кыра" in result and "балыста" in result:
             # If both parts are kept, check if hyphen is preserved
-            self.assertTrue("-" in result or " " in result)  # Either hyphen or space
+            assert "-" in result or " " in result  # Either hyphen or space
 
-    def test_line_break_hyphen_integration(self):
+    @pytest.mark.slow
+    def test_line_break_hyphen_integration(self, cleaner, cleaner_input):
         """Test that line-break hyphens are handled correctly in full pipeline."""
         # This would be after word healer processes the text
         test_text = "оҕо-\nлор баҕар"
-        with open(self.input_file, "w", encoding="utf-8") as f:
-            f.write(test_text)
-
-        cleaner = TextCleaner(
-            input_file=self.input_file, output_file=self.output_file, log_file=self.log_file
-        )
+        cleaner_input(test_text)
 
         # Run the full cleaning process
         cleaner.clean_text()
 
         # Read the output
-        with open(self.output_file, "r", encoding="utf-8") as f:
-            result = f.read()
+        result = cleaner.output_file.read_text(encoding="utf-8")
 
         # The hyphen-newline should have been removed by word healer
         # (if word healer is enabled and processes before Russian word removal)
-        self.assertNotIn("-\n", result)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert "-\n" not in result
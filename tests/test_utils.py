@@ -6,6 +6,8 @@ import unittest
 from pathlib import Path
 import tempfile
 import os
+import shutil
+from unittest.mock import patch
 
 from src.utils import validate_path, format_file_size, get_timestamp
 
@@ -13,15 +15,20 @@ from src.utils import validate_path, format_file_size, get_timestamp
 class TestUtils(unittest.TestCase):
     """Test cases for utility functions."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary directory shared by all tests in the class."""
+        cls.class_temp_dir = tempfile.mkdtemp()
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory once, after all tests."""
+        shutil.rmtree(cls.class_temp_dir, ignore_errors=True)
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    def setUp(self):
+        """Set up test fixtures in a per-test subdirectory of the shared directory."""
+        self.temp_dir = os.path.join(self.class_temp_dir, self._testMethodName)
+        os.mkdir(self.temp_dir)
 
     def test_validate_path_existing_file(self):
         """Test validate_path with existing file."""
@@ -43,6 +50,20 @@ class TestUtils(unittest.TestCase):
         result = validate_path(Path(self.temp_dir), must_exist=True, must_be_file=False)
         self.assertTrue(result)
 
+    def test_validate_path_wrong_type(self):
+        """Test validate_path rejects a directory where a file is required and vice versa."""
+        test_file = Path(self.temp_dir) / "test.txt"
+        test_file.write_text("test")
+
+        self.assertFalse(validate_path(Path(self.temp_dir), must_exist=True, must_be_file=True))
+        self.assertFalse(validate_path(test_file, must_exist=True, must_be_file=False))
+
+    def test_validate_path_not_required_to_exist(self):
+        """Test validate_path accepts a missing path when must_exist is False."""
+        test_file = Path(self.temp_dir) / "nonexistent.txt"
+
+        self.assertTrue(validate_path(test_file, must_exist=False))
+
     def test_format_file_size_bytes(self):
         """Test format_file_size with bytes."""
         result = format_file_size(500)
@@ -58,12 +79,28 @@ class TestUtils(unittest.TestCase):
         result = format_file_size(2097152)
         self.assertIn("MB", result)
 
+    def test_format_file_size_unit_boundaries(self):
+        """Test format_file_size switches units exactly at powers of 1024 and caps at TB."""
+        self.assertEqual(format_file_size(1023), "1023.0 B")
+        self.assertEqual(format_file_size(1024), "1.0 KB")
+        self.assertEqual(format_file_size(3 * 1024**3), "3.0 GB")
+        self.assertEqual(format_file_size(2048 * 1024**4), "2048.0 TB")
+
     def test_get_timestamp_format(self):
         """Test get_timestamp returns correct format."""
         timestamp = get_timestamp()
         # Should be in format YYYY-MM-DD HH:MM:SS
         self.assertRegex(timestamp, r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
 
+    def test_get_timestamp_reused_within_same_second(self):
+        """Test get_timestamp returns the cached string until the second changes."""
+        with patch("src.utils.time.time", return_value=1_700_000_000.2):
+            first = get_timestamp()
+        with patch("src.utils.time.time", return_value=1_700_000_000.9):
+            self.assertIs(get_timestamp(), first)
+        with patch("src.utils.time.time", return_value=1_700_000_001.0):
+            self.assertNotEqual(get_timestamp(), first)
+
 
 if __name__ == "__main__":
     unittest.main()